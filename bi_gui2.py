@@ -1,44 +1,995 @@
 import pandas as pd
 from PyQt5 import QtCore, QtGui, QtWidgets
+import os
 from os import sep, path
+import atexit
+import hashlib
+import json
+import re
+import zipfile
+from xml.etree import ElementTree
 import numpy as np
 import resource_rc
 import sys
+import tempfile
 import time
-from multiprocessing import Pool, cpu_count
-from threading import  Thread
+import shutil
+import weakref
+from itertools import combinations
+from collections import OrderedDict
+from multiprocessing import Pool, cpu_count, shared_memory
+from threading import  Thread, Lock, get_ident
 import dill
+import openpyxl
+import pyarrow as pa
+import pyarrow.dataset as dataset
+import pyarrow.feather as feather
+import pyarrow.parquet as parquet
 import pyqtgraph as pg
 
+
+def _headerNames(header):
+    '''Name header cells the way pandas does for blank and repeated labels.'''
+    names = list()
+    seen = dict()
+    for position, name in enumerate(header):
+        if name is None:
+            name = 'Unnamed: {0}'.format(position)
+        if name in seen:
+            seen[name] += 1
+            name = '{0}.{1}'.format(name, seen[name])
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+_SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PACKAGE_RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _columnNumber(letters):
+    '''Convert a column reference such as "AB" to its 1-based number.'''
+    number = 0
+    for eachLetter in letters:
+        number = number * 26 + ord(eachLetter) - ord('A') + 1
+    return number
+
+
+def _sheetDimension(archive, sheetPath):
+    '''Read the used range of a worksheet from its <dimension> tag, stopping before the cell data.'''
+    try:
+        with archive.open(sheetPath) as stream:
+            for _, element in ElementTree.iterparse(stream, events=('start',)):
+                if element.tag == _SPREADSHEET_NS + 'dimension':
+                    match = re.match(r'\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$', element.get('ref', ''))
+                    if match is None:
+                        break
+                    firstColumn, firstRow, lastColumn, lastRow = match.groups()
+                    lastColumn, lastRow = lastColumn or firstColumn, lastRow or firstRow
+                    return int(lastRow) - int(firstRow) + 1, _columnNumber(lastColumn) - _columnNumber(firstColumn) + 1
+                if element.tag == _SPREADSHEET_NS + 'sheetData':
+                    break
+    except KeyError:
+        pass
+    return None, None
+
+
+def readWorkbookManifest(filePath):
+    '''List the sheets of an xlsx file with their row/column counts, without loading any cells.'''
+    manifest = dict()
+    with zipfile.ZipFile(filePath) as archive:
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        relationships = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        targets = {eachRelationship.get('Id'): eachRelationship.get('Target')
+                   for eachRelationship in relationships.iter(_PACKAGE_RELATIONSHIP_NS + 'Relationship')}
+        for eachSheet in workbook.iter(_SPREADSHEET_NS + 'sheet'):
+            target = targets.get(eachSheet.get(_RELATIONSHIP_NS + 'id'), '')
+            sheetPath = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+            rows, columns = _sheetDimension(archive, sheetPath)
+            manifest[eachSheet.get('name')] = {'rows': rows, 'columns': columns}
+    return manifest
+
+
+def _normalizeCell(value):
+    '''Reduce a cell to a form that compares equal across the dtypes a column can be loaded as.'''
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.number)):
+        return None if value != value else float(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _frameFingerprint(df):
+    '''Hash the rows of df independently of how their columns are typed.'''
+    digest = hashlib.sha1()
+    for row in df.astype(object).itertuples(index=False, name=None):
+        digest.update(repr(tuple(_normalizeCell(value) for value in row)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _writeFeather(df, blobPath):
+    '''Atomically write an uncompressed Feather file, which can later be memory-mapped.'''
+    tmpPath = '{0}.{1}-{2}.tmp'.format(blobPath, os.getpid(), get_ident())
+    try:
+        feather.write_feather(df.reset_index(drop=True), tmpPath, compression='uncompressed')
+    except (ValueError, TypeError):
+        if path.exists(tmpPath):
+            os.remove(tmpPath)
+        return False
+    os.replace(tmpPath, blobPath)
+    return True
+
+
+def _readFeatherColumns(blobPath, columns, compressed=False):
+    '''Read some columns of a Feather file, touching only their pages when it is uncompressed.'''
+    if compressed:
+        # Only the requested columns are decompressed.
+        return feather.read_table(blobPath, columns=columns, memory_map=True).to_pandas(split_blocks=True)
+    # feather.read_table copies every column of an uncompressed file before selecting;
+    # record batches read straight off the memory map are views until converted.
+    table = pa.ipc.open_file(pa.memory_map(blobPath)).read_all().select(columns)
+    return table.to_pandas(split_blocks=True)
+
+
+def _ingestSheetWorker(task):
+    '''Parse one sheet in a worker process and hand it back through the sheet cache.'''
+    filePath, sheetName, blobPath = task
+    # A sheet that cannot be parsed is reported rather than raised, so that it
+    # does not abort the rest of the batch.
+    try:
+        df = pd.read_excel(filePath, sheet_name=sheetName)
+        if not all(isinstance(eachColumn, str) for eachColumn in df.columns):
+            return sheetName, 'column names are not all text'
+        if not _writeFeather(df, blobPath):
+            return sheetName, 'could not be cached'
+    except Exception as error:
+        return sheetName, str(error)
+    return sheetName, None
+
+
+_SUM_BIN_BITS = 20
+_PLAIN_SUM_BIN = 1 << 16
+
+
+def _sumBins(slots, values, groups):
+    '''Exact per-group sums of values on a fixed grid of binary exponents, one column per bin; see _finishSums.'''
+    # Each value is cut into at most four slices, each a multiple of its bin's unit and
+    # small enough that float64 adds up 2**31 of them without rounding. The grid does not
+    # depend on the data, so the bins of any split of the rows add up to those of all rows.
+    values = np.array(values, dtype=np.float64)
+    present = ~np.isnan(values)
+    if not present.all():
+        slots, values = slots[present], values[present]
+    bins = dict()
+    regular = np.abs(values) < 2.0 ** 960
+    if not regular.all():
+        # Infinities, and values too large for the grid, are added as they are.
+        bins[_PLAIN_SUM_BIN] = np.bincount(slots[~regular], weights=values[~regular], minlength=groups)
+        slots, values = slots[regular], values[regular]
+    if len(values):
+        top = np.maximum((np.frexp(values)[1] - 1) // _SUM_BIN_BITS, -50)
+        lowest = int(top.min()) - 3
+        width = int(top.max()) - lowest + 1
+        sliced = np.zeros(groups * width)
+        scale = np.ldexp(1.0, top * _SUM_BIN_BITS + 51)
+        cells = slots * width + (top - lowest)
+        piece = np.empty_like(values)
+        for level in range(4):
+            np.add(scale, values, out=piece)
+            piece -= scale
+            values -= piece
+            sliced += np.bincount(cells, weights=piece, minlength=groups * width)
+            if level < 3:
+                if not values.any():
+                    break
+                scale *= 2.0 ** -_SUM_BIN_BITS
+                cells -= 1
+        sliced = sliced.reshape(groups, width)
+        for eachBin in range(width):
+            bins[lowest + eachBin] = sliced[:, eachBin]
+    return pd.DataFrame(bins, index=pd.RangeIndex(groups))
+
+
+def _finishSums(bins):
+    '''Round exact sum bins to one total per group, adding them from the smallest bin up.'''
+    total = np.zeros(len(bins))
+    for eachBin in sorted(bins.columns):
+        total = total + bins[eachBin].to_numpy()
+    return total
+
+
+def _combineSumBins(partials, levels, dropna=True, plainColumns=(_PLAIN_SUM_BIN,)):
+    '''Add up the sum bins of partial results group by group; every addition is exact.'''
+    columns = list(dict.fromkeys(eachColumn for eachPartial in partials for eachColumn in eachPartial.columns))
+    stacked = pd.concat([eachPartial.reindex(columns=columns, fill_value=0) for eachPartial in partials])
+    combined = stacked.groupby(level=levels, observed=True, dropna=dropna).sum()
+    plainColumns = [eachColumn for eachColumn in plainColumns if eachColumn in combined.columns]
+    if plainColumns:
+        # NaN in a plain bin is infinities of both signs meeting; a grouped sum would skip it.
+        cancelled = stacked[plainColumns].isna().groupby(level=levels, observed=True, dropna=dropna).any()
+        combined[plainColumns] = combined[plainColumns].mask(cancelled)
+    return combined
+
+
+def _groupSumBins(grouped, values):
+    '''Sum bins of values per group of a pandas groupby, indexed like its results.'''
+    # Rows dropped for a missing key are numbered NaN or -1.
+    slots = grouped.ngroup().to_numpy(dtype=np.float64, na_value=-1)
+    index = grouped.size().index
+    counted = slots >= 0
+    bins = _sumBins(slots[counted].astype(np.int64), values[counted], len(index))
+    bins.index = index
+    return bins
+
+
+def _aggregatePairs(df, by, pairs, sumBins=None):
+    '''Reduce every (measurement, aggregation) pair per group of by, grouping the rows only once; sumBins collects the bins of exact sums.'''
+    grouped = df.groupby(by, observed=True)
+    # Float sums, and every mean, are added up exactly so that any split of the rows
+    # into chunks or partitions gives the same bits.
+    exact = {tuple(eachPair) for eachPair in pairs
+             if (eachPair[1] == 'sum' and pd.api.types.is_float_dtype(df[eachPair[0]].dtype))
+             or (eachPair[1] == 'mean' and pd.api.types.is_numeric_dtype(df[eachPair[0]].dtype)
+                 and not pd.api.types.is_bool_dtype(df[eachPair[0]].dtype))}
+    specification = dict()
+    for eachMeasurement, eachAggregation in pairs:
+        if eachAggregation != 'size' and (eachMeasurement, eachAggregation) not in exact:
+            specification.setdefault(eachMeasurement, list()).append(eachAggregation)
+    sizes = grouped.size()
+    result = grouped.agg(specification) if specification else pd.DataFrame(index=sizes.index)
+    bins = dict()
+    for eachMeasurement, eachAggregation in pairs:
+        if (eachMeasurement, eachAggregation) in exact and eachMeasurement not in bins:
+            bins[eachMeasurement] = _groupSumBins(grouped, df[eachMeasurement].to_numpy(dtype=np.float64, na_value=np.nan))
+    for eachMeasurement, eachAggregation in pairs:
+        if eachAggregation == 'size':
+            result[(eachMeasurement, 'size')] = sizes
+        elif (eachMeasurement, eachAggregation) in exact:
+            total = _finishSums(bins[eachMeasurement])
+            if eachAggregation == 'mean':
+                with np.errstate(invalid='ignore'):
+                    total = total / grouped[eachMeasurement].count().to_numpy()
+            result[(eachMeasurement, eachAggregation)] = total
+    if sumBins is not None:
+        sumBins.update(bins)
+    return result[[tuple(eachPair) for eachPair in pairs]]
+
+
+def _reduceKeys(key, frame, measurement, discrete, keySpace, sumBins=None):
+    '''Reduce the rows of frame by their integer group key; return the sorted keys present and their results, positionally indexed like sumBins.'''
+    if isinstance(measurement, (list, tuple)):
+        pairBins = dict()
+        grouped = _aggregatePairs(frame.set_axis(pd.RangeIndex(len(key))), key, measurement, pairBins)
+        if sumBins is not None:
+            sumBins.update({eachMeasurement: bins.reset_index(drop=True) for eachMeasurement, bins in pairBins.items()})
+        return grouped.index.to_numpy().astype(np.int64), grouped.reset_index(drop=True)
+
+    if keySpace > max(2 * len(key), 2 ** 20):
+        # Sparse key space: number the keys that occur, in key order.
+        groupKeys, slots = np.unique(key, return_inverse=True)
+        counts = np.bincount(slots, minlength=len(groupKeys))
+    else:
+        counts = np.bincount(key, minlength=keySpace)
+        groupKeys = np.flatnonzero(counts)
+        # Number the keys that occur, so that sum bins are only kept for them.
+        slots = (np.cumsum(counts > 0) - 1)[key]
+        counts = counts[groupKeys]
+    if discrete:
+        return groupKeys.astype(np.int64), pd.DataFrame({'Amount': counts.astype(np.int64)})
+    # The same exact sums as the pandas path, so that either gives the same bits. Slicing
+    # every value four times costs these about what a plain pandas sum costs; only counts
+    # keep the full speed of a single bincount.
+    bins = _sumBins(slots, frame[measurement].to_numpy(dtype=np.float64, na_value=np.nan), len(groupKeys))
+    if sumBins is not None:
+        sumBins[measurement] = bins
+    return groupKeys.astype(np.int64), pd.DataFrame({measurement: _finishSums(bins)})
+
+
+def _sharedSlice(spec, start, stop):
+    '''Copy rows start:stop of an array in shared memory, described by (name, shape, dtype).'''
+    block = shared_memory.SharedMemory(name=spec[0])
+    try:
+        return np.ndarray(spec[1], dtype=spec[2], buffer=block.buf)[start:stop].copy()
+    finally:
+        block.close()
+
+
+def _reduceRangeWorker(task):
+    '''Reduce one contiguous range of rows of shared memory columns in a worker process.'''
+    keySpec, columnSpecs, start, stop, measurement, discrete, keySpace = task
+    key = _sharedSlice(keySpec, start, stop)
+    columns = {eachName: _sharedSlice(spec, start, stop) for eachName, spec in columnSpecs}
+    sumBins = dict()
+    groupKeys, grouped = _reduceKeys(key, pd.DataFrame(columns, index=pd.RangeIndex(len(key))), measurement, discrete, keySpace, sumBins)
+    return groupKeys, grouped, sumBins
+
+
+def syntheticFrame(rows=1000000, seed=0):
+    '''A table shaped like our operational sheets, for benchmarking.'''
+    generator = np.random.default_rng(seed)
+    return pd.DataFrame({'Region': pd.Categorical(generator.choice(['North', 'Northeast', 'South', 'West'], rows)),
+                         'Product': generator.choice(['P{0:04d}'.format(number) for number in range(2000)], rows),
+                         'Year': generator.integers(2010, 2025, rows).astype(np.int16),
+                         'Quantity': generator.integers(0, 500, rows),
+                         'Sales': np.round(generator.gamma(2.0, 150.0, rows), 2),
+                         'Discount': generator.random(rows)})
+
+
+def benchmarkCodecs(frames, codecs=(('uncompressed', None), ('lz4', None), ('zstd', 1), ('zstd', 3), ('zstd', 9)), directory=None):
+    '''Time writing and reading each frame as a project blob under each (codec, level).'''
+    directory = directory or tempfile.mkdtemp(prefix='bi_benchmark_')
+    results = list()
+    for eachName, df in frames.items():
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        megabytes = table.nbytes / 1024 ** 2
+        for codec, level in codecs:
+            blobPath = path.join(directory, 'blob.feather')
+            startTime = time.perf_counter()
+            feather.write_feather(table, blobPath, compression=codec, compression_level=level)
+            writeTime = time.perf_counter() - startTime
+            startTime = time.perf_counter()
+            feather.read_table(blobPath, memory_map=False).to_pandas()
+            readTime = time.perf_counter() - startTime
+            results.append({'frame': eachName, 'codec': codec, 'level': level,
+                            'writeMBs': megabytes / writeTime, 'readMBs': megabytes / readTime,
+                            'ratio': table.nbytes / os.path.getsize(blobPath)})
+            os.remove(blobPath)
+    return results
+
+
+def runBenchmark(filePaths):
+    '''Benchmark project codecs on a synthetic table and on every sheet of the given files.'''
+    frames = {'synthetic': syntheticFrame()}
+    dataOrganization = DataOrganization()
+    for eachPath in filePaths:
+        extension = eachPath.split('.')[-1]
+        if extension == 'parquet':
+            dataOrganization.readParquet(eachPath)
+        elif extension in ('csv', 'tsv'):
+            dataOrganization.readDelimited(eachPath, '\t' if extension == 'tsv' else ',')
+        else:
+            dataOrganization.readExcel(eachPath)
+        dataOrganization.getSheet()
+        for eachSheet in dataOrganization.workSheet['sheets']:
+            df = dataOrganization.loadSheetFrame(eachSheet, 50000)
+            dimensions = dataOrganization.getColumnsType(df)['dimensions']
+            frames['{0}:{1}'.format(path.basename(eachPath), eachSheet)] = dataOrganization.compactFrame(df, dimensions)[0]
+
+    print('{0:<40} {1:<14} {2:>10} {3:>10} {4:>7}'.format('frame', 'codec', 'write MB/s', 'read MB/s', 'ratio'))
+    for eachResult in benchmarkCodecs(frames):
+        codec = eachResult['codec'] if eachResult['level'] is None else '{0}-{1}'.format(eachResult['codec'], eachResult['level'])
+        print('{0:<40} {1:<14} {2:>10.0f} {3:>10.0f} {4:>7.2f}'.format(eachResult['frame'][:40], codec, eachResult['writeMBs'],
+                                                                       eachResult['readMBs'], eachResult['ratio']))
+
+
+class SheetCache:
+    '''Columnar sidecar cache of parsed sheets, keyed by workbook content hash and sheet name.'''
+    def __init__(self, directory=None, maxBytes=4 * 1024 ** 3):
+        self.directory = directory or path.join(path.expanduser('~'), '.bi_cache')
+        self.maxBytes = maxBytes
+        self.indexPath = path.join(self.directory, 'index.json')
+
+    def _loadIndex(self):
+        try:
+            with open(self.indexPath, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return dict()
+
+    def _saveIndex(self, index):
+        os.makedirs(self.directory, exist_ok=True)
+        tmpPath = '{0}.{1}-{2}.tmp'.format(self.indexPath, os.getpid(), get_ident())
+        with open(tmpPath, 'w') as file:
+            json.dump(index, file)
+        os.replace(tmpPath, self.indexPath)
+
+    def fileHash(self, filePath):
+        '''Content hash of a file, reused while its size and mtime are unchanged.'''
+        fileStat = os.stat(filePath)
+        filePath = path.abspath(filePath)
+        index = self._loadIndex()
+        entry = index.get(filePath)
+        if entry is not None and entry['size'] == fileStat.st_size and entry['mtime'] == fileStat.st_mtime_ns:
+            return entry['hash']
+
+        # Size or mtime moved: rehash. An unchanged hash keeps the cached sheets valid.
+        digest = hashlib.sha1()
+        with open(filePath, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        index[filePath] = {'size': fileStat.st_size, 'mtime': fileStat.st_mtime_ns, 'hash': digest.hexdigest()}
+        self._saveIndex(index)
+        return index[filePath]['hash']
+
+    def blobPath(self, filePath, sheetName):
+        '''Cache location of a sheet of the current version of filePath.'''
+        os.makedirs(self.directory, exist_ok=True)
+        key = hashlib.sha1('{0}/{1}'.format(self.fileHash(filePath), sheetName).encode('utf-8')).hexdigest()
+        return path.join(self.directory, key + '.feather')
+
+    def load(self, filePath, sheetName):
+        '''Return the cached DataFrame of a sheet, or None on a miss.'''
+        blobPath = self.blobPath(filePath, sheetName)
+        if not path.exists(blobPath):
+            return None
+        # Touch the blob so eviction sees it as recently used.
+        os.utime(blobPath)
+        table = feather.read_table(blobPath, memory_map=True)
+        return table.to_pandas(split_blocks=True)
+
+    def store(self, filePath, sheetName, df):
+        '''Write a parsed sheet to the cache. Sheets Arrow cannot represent are skipped.'''
+        if not all(isinstance(eachColumn, str) for eachColumn in df.columns):
+            return False
+        stored = _writeFeather(df, self.blobPath(filePath, sheetName))
+        if stored:
+            self.evict()
+        return stored
+
+    def storeChunks(self, filePath, sheetName, chunks):
+        '''Write a sheet to the cache chunk by chunk as it is parsed, so that it is never whole in memory; False if Arrow cannot represent it.'''
+        blobPath = self.blobPath(filePath, sheetName)
+        partsPath = '{0}.{1}-{2}.parts'.format(blobPath, os.getpid(), get_ident())
+        tmpPath = '{0}.{1}-{2}.tmp'.format(blobPath, os.getpid(), get_ident())
+        os.makedirs(partsPath, exist_ok=True)
+        try:
+            # Chunks can disagree on the type of a column (ints then floats, a run of blank
+            # cells), so each is spilled as it arrives and the sheet is written in one type
+            # per column, the one concatenating the chunks would give, once all are read.
+            parts = list()
+            for chunk in chunks:
+                if not all(isinstance(eachColumn, str) for eachColumn in chunk.columns):
+                    return False
+                try:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False).replace_schema_metadata(None)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError):
+                    return False
+                for position, eachColumn in enumerate(chunk.columns):
+                    if chunk[eachColumn].isna().all():
+                        table = table.set_column(position, eachColumn, pa.nulls(len(table)))
+                partPath = path.join(partsPath, '{0}.feather'.format(len(parts)))
+                feather.write_feather(table, partPath, compression='uncompressed')
+                parts.append((partPath, table.schema))
+            if not parts:
+                return False
+            try:
+                schema = pa.unify_schemas([schema for _, schema in parts], promote_options='permissive')
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                return False
+            # Columns blank throughout are float, as ExcelFile.parse types them.
+            schema = pa.schema([pa.field(field.name, pa.float64()) if pa.types.is_null(field.type) else field for field in schema])
+            try:
+                with pa.ipc.new_file(tmpPath, schema) as writer:
+                    for partPath, _ in parts:
+                        writer.write_table(feather.read_table(partPath, memory_map=False).cast(schema))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                os.remove(tmpPath)
+                return False
+            os.replace(tmpPath, blobPath)
+        finally:
+            shutil.rmtree(partsPath, ignore_errors=True)
+        self.evict()
+        return True
+
+    def evict(self):
+        '''Delete least recently used blobs until the cache fits in maxBytes.'''
+        blobs = list()
+        for eachName in os.listdir(self.directory):
+            if eachName.endswith('.feather'):
+                blobStat = os.stat(path.join(self.directory, eachName))
+                blobs.append((blobStat.st_mtime, blobStat.st_size, eachName))
+        totalBytes = sum(size for _, size, _ in blobs)
+        for _, size, eachName in sorted(blobs):
+            if totalBytes <= self.maxBytes:
+                break
+            os.remove(path.join(self.directory, eachName))
+            totalBytes -= size
+
+
+class BlobStore:
+    '''Content-addressed store of DataFrame blobs shared by every saved project.'''
+    def __init__(self, directory=None, gracePeriod=3600):
+        self.directory = directory or path.join(path.expanduser('~'), '.bi_store')
+        self.blobDirectory = path.join(self.directory, 'blobs')
+        self.registryPath = path.join(self.directory, 'projects.json')
+        self.gracePeriod = gracePeriod
+        self.lock = Lock()
+
+    def _loadRegistry(self):
+        try:
+            with open(self.registryPath, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return list()
+
+    def _saveRegistry(self, projects):
+        tmpPath = '{0}.{1}-{2}.tmp'.format(self.registryPath, os.getpid(), get_ident())
+        with open(tmpPath, 'w') as file:
+            json.dump(projects, file)
+        os.replace(tmpPath, self.registryPath)
+
+    def register(self, projectPath):
+        '''Remember a project manifest so garbage collection keeps the blobs it references.'''
+        projectPath = path.abspath(projectPath)
+        with self.lock:
+            os.makedirs(self.blobDirectory, exist_ok=True)
+            projects = self._loadRegistry()
+            if projectPath not in projects:
+                projects.append(projectPath)
+                self._saveRegistry(projects)
+
+    def collectGarbage(self):
+        '''Delete blobs no registered project references; return how many were removed and the bytes freed.'''
+        with self.lock:
+            # Nothing has been saved yet.
+            if not path.isdir(self.blobDirectory):
+                return 0, 0
+            projects = list()
+            referenced = set()
+            referencedKeys = set()
+            for eachProject in self._loadRegistry():
+                try:
+                    with open(eachProject, 'r') as file:
+                        manifest = json.load(file)
+                except (OSError, ValueError):
+                    continue
+                projects.append(eachProject)
+                for entry in manifest['frames'].values():
+                    # Entries written before blobs were named by codec reference every blob of their key.
+                    if 'blob' in entry:
+                        referenced.add(entry['blob'])
+                    else:
+                        referencedKeys.add(entry['key'])
+            self._saveRegistry(projects)
+
+            removed, freed = 0, 0
+            # Blobs written within the grace period may belong to a save still in progress.
+            cutoff = time.time() - self.gracePeriod
+            for eachName in os.listdir(self.blobDirectory):
+                blobPath = path.join(self.blobDirectory, eachName)
+                blobStat = os.stat(blobPath)
+                if (eachName not in referenced and eachName.split('.')[0] not in referencedKeys
+                        and blobStat.st_mtime < cutoff):
+                    os.remove(blobPath)
+                    removed += 1
+                    freed += blobStat.st_size
+            return removed, freed
+
+
+class AggregationCache:
+    '''In-memory LRU of grouped results, keyed by the shape of the query that produced them.'''
+    def __init__(self, maxBytes=256 * 1024 ** 2):
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict()
+        self.totalBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.rollups = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    def get(self, key):
+        '''Return the cached result for key, or None on a miss.'''
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def findFiner(self, key):
+        '''Smallest cached result of the same query over a superset of its dimensions, with its null dimensions and sum bins, or None.'''
+        # Grouping drops rows with a missing key, so a finer result only rolls up
+        # exactly when none of its extra dimensions had missing values, and its
+        # float sums only when their exact bins were kept.
+        dimensions = set(key[2])
+        with self.lock:
+            candidates = [(len(df), eachKey, df) for eachKey, (df, _, nullDimensions, sumBins) in self.entries.items()
+                          if eachKey[:2] == key[:2] and eachKey[3:] == key[3:] and dimensions < set(eachKey[2])
+                          and not (set(eachKey[2]) - dimensions) & nullDimensions and sumBins is not None]
+            if not candidates:
+                return None
+            _, finerKey, df = min(candidates, key=lambda candidate: candidate[0])
+            self.entries.move_to_end(finerKey)
+            self.rollups += 1
+            return df, self.entries[finerKey][2], self.entries[finerKey][3]
+
+    def sumBins(self, key):
+        '''The sum bins kept with the cached result for key, or None.'''
+        with self.lock:
+            entry = self.entries.get(key)
+            return None if entry is None else entry[3]
+
+    def put(self, key, df, nullDimensions=frozenset(), sumBins=None):
+        '''Remember df, and the bins of its exact sums if known, under key, evicting least recently used results to stay within maxBytes.'''
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        size += sum(int(bins.memory_usage(index=False).sum()) for bins in (sumBins or dict()).values())
+        with self.lock:
+            if key in self.entries:
+                self.totalBytes -= self.entries.pop(key)[1]
+            if size > self.maxBytes:
+                return
+            self.entries[key] = (df, size, frozenset(nullDimensions), sumBins)
+            self.totalBytes += size
+            while self.totalBytes > self.maxBytes:
+                _, (_, evictedSize, _, _) = self.entries.popitem(last=False)
+                self.totalBytes -= evictedSize
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.totalBytes = 0
+
+    def statistics(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self.entries), 'bytes': self.totalBytes, 'hits': self.hits, 'misses': self.misses,
+                    'rollups': self.rollups, 'evictions': self.evictions, 'hitRate': self.hits / lookups if lookups else 0.0}
+
+
 class FileManagement:
+    compactOnLoad = True
+    categoryRatio = 0.5
+    projectCodec = 'zstd'
+    projectCodecLevel = 1
+
     def __init__(self):
-        self.workSheet = {'excel': None,
-                          'sheets': list(),
-                          'df':pd.DataFrame(),
-                          'selectedColumns':list(),
-                          'selectedRows':list(),
-                          'columnsValue': dict(),
-                          'currentSelectedFilter':None,
-                          'previousCurrentRow':None,
-                          'filteredColumns':set(),
-                          'dimensions':list(),
-                          'measurements':list(),
-                          'grouped':{'df':pd.DataFrame(), 'columns':list(), 'filterGrouped':pd.DataFrame(), 'graph':tuple()}}
+        self.sheetCache = SheetCache()
+        self.blobStore = BlobStore()
+        self.ingestedSheets = dict()
+        self.frameKeys = dict()
+        self.savedManifests = dict()
+        self.workSheet = self.newWorkSheet()
+
+    def newWorkSheet(self):
+        '''Work sheet state with nothing loaded.'''
+        return {'excel': None,
+                'filePath': None,
+                'format': 'xlsx',
+                'separator': ',',
+                'sheetDimensions': dict(),
+                'sheets': list(),
+                'sheetName': None,
+                'projection': None,
+                'df':pd.DataFrame(),
+                'selectedColumns':list(),
+                'selectedRows':list(),
+                'columnsValue': dict(),
+                'currentSelectedFilter':None,
+                'previousCurrentRow':None,
+                'filteredColumns':set(),
+                'dimensions':list(),
+                'measurements':list(),
+                'grouped':{'df':pd.DataFrame(), 'columns':list(), 'filterGrouped':pd.DataFrame(), 'graph':tuple()},
+                'cube':None}
 
     def readExcel(self, filePath):
-        '''Read excel file.'''
-        self.workSheet['excel'] = pd.ExcelFile(filePath)
+        '''Read excel file manifest. The workbook itself is opened on first parse.'''
+        self.workSheet['excel'] = None
+        self.workSheet['filePath'] = filePath
+        self.workSheet['format'] = 'xlsx'
+        self.ingestedSheets = dict()
+        try:
+            self.workSheet['sheetDimensions'] = readWorkbookManifest(filePath)
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            self.workSheet['sheetDimensions'] = dict()
+
+    def readDelimited(self, filePath, separator=','):
+        '''Read a CSV/TSV file as a single sheet, estimating its row count from the first megabyte.'''
+        self.workSheet['excel'] = None
+        self.workSheet['filePath'] = filePath
+        self.workSheet['format'] = 'csv'
+        self.workSheet['separator'] = separator
+        self.ingestedSheets = dict()
+        with open(filePath, 'rb') as file:
+            head = file.read(1024 * 1024)
+        fileSize = os.path.getsize(filePath)
+        rows = head.count(b'\n')
+        if fileSize > len(head) and rows > 0:
+            rows = int(rows * fileSize / len(head))
+        header = pd.read_csv(filePath, sep=separator, nrows=0)
+        self.workSheet['sheetDimensions'] = {path.basename(filePath): {'rows': rows, 'columns': len(header.columns)}}
+
+    def readParquet(self, filePath):
+        '''Read a Parquet file as a single sheet, taking its size from the footer metadata.'''
+        self.workSheet['excel'] = None
+        self.workSheet['filePath'] = filePath
+        self.workSheet['format'] = 'parquet'
+        self.ingestedSheets = dict()
+        metadata = parquet.ParquetFile(filePath).metadata
+        self.workSheet['sheetDimensions'] = {path.basename(filePath): {'rows': metadata.num_rows + 1, 'columns': metadata.num_columns}}
+
+    def usesSheetCache(self):
+        '''Whether parsed tables of the current file go through the sheet cache; Parquet is read directly.'''
+        return self.workSheet.get('filePath') is not None and self.workSheet.get('format', 'xlsx') != 'parquet'
+
+    def getExcelFile(self):
+        '''Open the workbook with pandas if that has not happened yet.'''
+        if self.workSheet['excel'] is None:
+            self.workSheet['excel'] = pd.ExcelFile(self.workSheet['filePath'])
+        return self.workSheet['excel']
 
     def getSheet(self):
         '''Get sheets list.'''
-        self.workSheet['sheets'] = self.workSheet['excel'].sheet_names
+        if self.workSheet.get('sheetDimensions'):
+            self.workSheet['sheets'] = list(self.workSheet['sheetDimensions'])
+        else:
+            self.workSheet['sheets'] = self.getExcelFile().sheet_names
+
+    def ingestAllSheets(self, processes=None):
+        '''Parse every sheet across a process pool, returning {sheet: error} for the sheets that failed.'''
+        # Workers hand sheets back as Arrow files in the sheet cache rather than pickled
+        # DataFrames; memory-mapping them here lets numeric columns arrive without a copy.
+        filePath = self.workSheet['filePath']
+        sheets = list(self.workSheet['sheets'])
+        failures = dict()
+        if self.workSheet.get('format', 'xlsx') != 'xlsx':
+            return failures
+        tasks = list()
+        for eachSheet in sheets:
+            blobPath = self.sheetCache.blobPath(filePath, eachSheet)
+            if not path.exists(blobPath):
+                tasks.append((filePath, eachSheet, blobPath))
+
+        if tasks:
+            with Pool(processes or min(cpu_count(), len(tasks))) as pool:
+                for sheetName, error in pool.imap_unordered(_ingestSheetWorker, tasks):
+                    if error is not None:
+                        failures[sheetName] = error
+            self.sheetCache.evict()
+
+        ingestedSheets = dict()
+        for eachSheet in sheets:
+            df = self.sheetCache.load(filePath, eachSheet)
+            if df is not None:
+                ingestedSheets[eachSheet] = df
+        # Another file may have been opened while the sheets were being parsed.
+        if self.workSheet.get('filePath') == filePath:
+            self.ingestedSheets.update(ingestedSheets)
+        return failures
+
+    def iterSheetChunks(self, sheetName, chunkSize=50000, columns=None, skipRows=0, filters=None):
+        '''Yield a sheet of the current file as typed DataFrame chunks; filters may drop excluded rows early but callers still apply them.'''
+        fileFormat = self.workSheet.get('format', 'xlsx')
+        if fileFormat == 'csv':
+            return self.iterDelimitedChunks(chunkSize, columns, skipRows)
+        if fileFormat == 'parquet':
+            return self.iterParquetChunks(chunkSize, columns, skipRows, filters)
+        return self.iterExcelChunks(sheetName, chunkSize, columns, skipRows)
+
+    def iterDelimitedChunks(self, chunkSize=50000, columns=None, skipRows=0, sampleRows=10000):
+        '''Yield a CSV/TSV file in chunks, typing text columns from a sample so chunks agree.'''
+        filePath = self.workSheet['filePath']
+        separator = self.workSheet.get('separator', ',')
+        sample = pd.read_csv(filePath, sep=separator, nrows=sampleRows, usecols=columns)
+        # Numeric columns are left to per-chunk inference, where int and float chunks
+        # concatenate to float; text columns are pinned so digits-only chunks stay text.
+        dtypes = {eachColumn: eachDataType for eachColumn, eachDataType in sample.dtypes.items()
+                  if not pd.api.types.is_numeric_dtype(eachDataType) and not pd.api.types.is_datetime64_any_dtype(eachDataType)}
+        reader = pd.read_csv(filePath, sep=separator, usecols=columns, dtype=dtypes, chunksize=chunkSize,
+                             skiprows=range(1, skipRows + 1) if skipRows else None)
+        with reader:
+            for chunk in reader:
+                yield chunk if columns is None else chunk[columns]
+
+    def iterParquetChunks(self, chunkSize=50000, columns=None, skipRows=0, filters=None):
+        '''Yield a Parquet file in chunks, reading only the requested columns and the row groups filters can match.'''
+        source = dataset.dataset(self.workSheet['filePath'], format='parquet')
+        expression = self.parquetFilter(filters, source.schema)
+        for batch in source.to_batches(columns=columns, filter=expression, batch_size=chunkSize):
+            if skipRows >= batch.num_rows:
+                skipRows -= batch.num_rows
+                continue
+            yield batch.slice(skipRows).to_pandas()
+            skipRows = 0
+
+    def parquetFilter(self, filters, schema):
+        '''Translate (column, excluded values) filters into a pyarrow expression, or None when nothing is filtered.'''
+        expression = None
+        for eachColumn, excluded in filters or tuple():
+            field = dataset.field(eachColumn)
+            values = [value for value in self.getColumnValues(eachColumn) if pd.notna(value) and str(value) in excluded]
+            try:
+                keep = ~field.isin(pa.array(values, type=schema.field(eachColumn).type)) if values else None
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError):
+                # Left to applyFilters on the chunks.
+                continue
+            # Missing values are excluded through 'nan' only, and isin() is null on them.
+            if str(np.nan) in excluded:
+                keep = field.is_valid() if keep is None else keep & field.is_valid()
+            elif keep is not None:
+                keep = keep | field.is_null()
+            if keep is not None:
+                expression = keep if expression is None else expression & keep
+        return expression
+
+    def iterExcelChunks(self, sheetName, chunkSize=50000, columns=None, skipRows=0):
+        '''Yield a sheet as typed DataFrame chunks, streaming rows in read-only mode.'''
+        workbook = openpyxl.load_workbook(self.workSheet['filePath'], read_only=True, data_only=True)
+        try:
+            rows = workbook[sheetName].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            names = _headerNames(header)
+            if columns is None:
+                columns = names
+            positions = [names.index(eachColumn) for eachColumn in columns]
+            buffer = list()
+            for row in rows:
+                # Blank rows are skipped, as ExcelFile.parse does, judging the whole row
+                # so that projected columns read separately stay aligned.
+                if all(value is None for value in row):
+                    continue
+                if skipRows > 0:
+                    skipRows -= 1
+                    continue
+                buffer.append(tuple(row[position] if position < len(row) else None for position in positions))
+                if len(buffer) == chunkSize:
+                    yield self.recordsFrame(buffer, columns)
+                    buffer = list()
+            if buffer:
+                yield self.recordsFrame(buffer, columns)
+        finally:
+            workbook.close()
+
+    def recordsFrame(self, records, columns):
+        '''Build a chunk from sheet rows, typing all-blank columns as float like ExcelFile.parse.'''
+        df = pd.DataFrame.from_records(records, columns=columns)
+        # A run of blank cells would otherwise make a numeric column object in this
+        # chunk and, once concatenated, in the whole frame.
+        blankColumns = [eachColumn for eachColumn in df.columns
+                        if df[eachColumn].dtype == object and df[eachColumn].isna().all()]
+        if blankColumns:
+            df = df.astype({eachColumn: 'float64' for eachColumn in blankColumns})
+        return df
+
+    def streamSheet(self, sheetName, chunkSize=50000, onChunk=None):
+        '''Read a sheet chunk by chunk, calling onChunk(chunk, rowsRead) as each one arrives.'''
+        chunks = list()
+        rowsRead = 0
+        for chunk in self.iterSheetChunks(sheetName, chunkSize):
+            chunks.append(chunk)
+            rowsRead += len(chunk)
+            if onChunk is not None:
+                onChunk(chunk, rowsRead)
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True).infer_objects()
+
+    def loadSheetFrame(self, sheetName, chunkSize=None, onChunk=None):
+        '''Load a table from the ingested sheets, the sheet cache or the workbook, without touching the work sheet state.'''
+        filePath = self.workSheet.get('filePath')
+        df = self.ingestedSheets.get(sheetName)
+        if df is None and self.usesSheetCache():
+            df = self.sheetCache.load(filePath, sheetName)
+            if df is not None and onChunk is not None:
+                onChunk(df, len(df))
+
+        if df is None:
+            if chunkSize is None and self.workSheet.get('format', 'xlsx') == 'xlsx':
+                df = self.getExcelFile().parse(sheetName)
+            else:
+                df = self.streamSheet(sheetName, chunkSize or 50000, onChunk)
+            if self.usesSheetCache():
+                self.sheetCache.store(filePath, sheetName, df)
+        return df
+
+    def sampleSheet(self, sheetName, sampleRows=1000):
+        '''Read the header and the first sampleRows rows of a sheet.'''
+        df = self.ingestedSheets.get(sheetName)
+        if df is not None:
+            return df.head(sampleRows)
+        chunks = self.iterSheetChunks(sheetName, sampleRows)
+        sample = next(chunks, None)
+        chunks.close()
+        return pd.DataFrame() if sample is None else sample
+
+    def loadSheetColumns(self, sheetName, columns):
+        '''Read only the given columns of a sheet.'''
+        df = self.ingestedSheets.get(sheetName)
+        if df is not None:
+            return df[columns]
+        if self.usesSheetCache():
+            filePath = self.workSheet['filePath']
+            blobPath = self.sheetCache.blobPath(filePath, sheetName)
+            if not path.exists(blobPath):
+                # Any column costs a pass over the whole file, so the first one read
+                # parses every column and caches the sheet for the ones asked for later,
+                # one chunk at a time. The columns asked for are kept in case it cannot be.
+                pieces = list()
+                def recordedChunks():
+                    for chunk in self.iterSheetChunks(sheetName):
+                        pieces.append(chunk[columns])
+                        yield chunk
+                chunks = recordedChunks()
+                if not self.sheetCache.storeChunks(filePath, sheetName, chunks):
+                    for _ in chunks:
+                        pass
+                    if not pieces:
+                        return pd.DataFrame(columns=columns)
+                    return pd.concat(pieces, ignore_index=True).infer_objects()
+                pieces.clear()
+            return _readFeatherColumns(blobPath, columns)
+        chunks = list(self.iterSheetChunks(sheetName, columns=columns))
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(chunks, ignore_index=True).infer_objects()
+
+    def compactFrame(self, df, dimensions):
+        '''Shrink a loaded table and return it with its memory use before and after.'''
+        before = df.memory_usage(deep=True).sum()
+        columns = dict()
+        for eachColumn in df.columns:
+            series = df[eachColumn]
+            if pd.api.types.is_bool_dtype(series.dtype):
+                pass
+            elif pd.api.types.is_integer_dtype(series.dtype):
+                series = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+                if eachColumn in dimensions and series.nunique(dropna=False) <= self.categoryRatio * len(series):
+                    series = series.astype('category')
+                elif pd.api.types.is_object_dtype(series.dtype) and pd.api.types.infer_dtype(series, skipna=True) == 'string':
+                    series = series.astype('string[pyarrow]')
+            columns[eachColumn] = series
+        compact = pd.DataFrame(columns, index=df.index)
+        return compact, before, compact.memory_usage(deep=True).sum()
+
+    def loadProjectedColumns(self, columns):
+        '''Read columns of a projected table from the project blob or the source sheet behind it.'''
+        projection = self.workSheet['projection']
+        if projection.get('entry') is not None:
+            # Memory-mapped: only the pages of the requested columns are read, and
+            # uncompressed blobs are not even copied.
+            blobPath = path.join(projection['directory'], self.blobName(projection['entry']))
+            return _readFeatherColumns(blobPath, columns, projection['entry'].get('codec') != 'uncompressed')
+        loaded = self.loadSheetColumns(projection['sheetName'], columns)
+        if self.compactOnLoad:
+            loaded = self.compactFrame(loaded, self.workSheet['dimensions'])[0]
+        return loaded
+
+    def materializeColumns(self, columns):
+        '''Load the columns of a projected table that have not been read yet.'''
+        missing = [eachColumn for eachColumn in dict.fromkeys(columns) if eachColumn not in self.workSheet['df'].columns]
+        projection = self.workSheet.get('projection')
+        if missing and projection is not None:
+            # Columns already placed on the rows, columns or filter are read in the same pass.
+            inUse = self.workSheet['selectedRows'] + self.workSheet['selectedColumns'] + [self.workSheet['currentSelectedFilter']]
+            missing += [eachColumn for eachColumn in dict.fromkeys(inUse)
+                        if eachColumn in projection['columns'] and eachColumn not in missing and eachColumn not in self.workSheet['df'].columns]
+            loaded = self.loadProjectedColumns(missing)
+            if len(self.workSheet['df'].columns) == 0:
+                self.workSheet['df'] = loaded
+            else:
+                self.workSheet['df'] = pd.concat([self.workSheet['df'], loaded], axis=1)
+        return self.workSheet['df']
+
+    def readSheet(self, sheetName, chunkSize=None, onChunk=None):
+        '''Read a table from sheetname, streaming it in chunks when chunkSize is given.'''
+        self.setSheetFrame(self.loadSheetFrame(sheetName.text(), chunkSize, onChunk), sheetName=sheetName.text())
 
-    def readSheet(self, sheetName):
-        '''Read a table from sheetname.'''
+    def setSheetFrame(self, df, sheetName=None, projection=None):
+        '''Reset the work sheet state around a new table; projection describes where the columns a projected table lacks come from.'''
         if 'df' in self.workSheet:
             self.workSheet = {'excel':self.workSheet['excel'],
+                              'filePath': self.workSheet.get('filePath'),
+                              'format': self.workSheet.get('format', 'xlsx'),
+                              'separator': self.workSheet.get('separator', ','),
+                              'sheetDimensions': self.workSheet.get('sheetDimensions', dict()),
                               'sheets': self.workSheet['sheets'],
-                              'df':self.workSheet['excel'].parse(sheetName.text()),
+                              'sheetName': sheetName,
+                              'sourceKey': self.sourceKey(sheetName),
+                              'projection': projection,
+                              'df':df,
                               'selectedColumns':list(),
                               'selectedRows':list(),
                               'columnsValue':dict(),
@@ -47,19 +998,264 @@ class FileManagement:
                               'filteredColumns':set(),
                               'dimensions':list(),
                               'measurements':list(),
-                              'grouped':{'df':pd.DataFrame(), 'columns':list(), 'filterGrouped':pd.DataFrame(), 'graph':tuple()}}
+                              'grouped':{'df':pd.DataFrame(), 'columns':list(), 'filterGrouped':pd.DataFrame(), 'graph':tuple()},
+                              'cube':None}
             self.workSheet['grouped']['filterGrouped'] = self.workSheet['df']
         else:
-            self.workSheet['df'] = self.workSheet['excel'].parse(sheetName.text())
+            self.workSheet['df'] = df
+            self.workSheet['sheetName'] = sheetName
+            self.workSheet['sourceKey'] = self.sourceKey(sheetName)
+            self.workSheet['projection'] = projection
             self.workSheet['grouped']['filterGrouped'] = self.workSheet['df']
 
+    def sourceKey(self, sheetName):
+        '''Cheap identity of the current version of a sheet on disk, or None when the table did not come from one.'''
+        filePath = self.workSheet.get('filePath')
+        if sheetName is None or not filePath or not path.exists(filePath):
+            return None
+        fileStat = os.stat(filePath)
+        return '{0}:{1}:{2}/{3}'.format(path.abspath(filePath), fileStat.st_size, fileStat.st_mtime_ns, sheetName)
+
+    def readAppendedRows(self, tailRows=100, chunkSize=50000):
+        '''Read the rows appended to the current sheet since it was loaded, or None if it must be reloaded.'''
+        sheetName = self.workSheet.get('sheetName')
+        df = self.workSheet['df']
+        if sheetName is None or self.workSheet.get('projection') is not None or len(df.columns) == 0:
+            return None
+
+        # The workbook on disk has changed, so anything read from the old version is stale.
+        filePath = self.workSheet['filePath']
+        self.workSheet['excel'] = None
+        self.ingestedSheets.pop(sheetName, None)
+        if self.workSheet.get('format', 'xlsx') == 'xlsx':
+            try:
+                self.workSheet['sheetDimensions'] = readWorkbookManifest(filePath)
+            except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+                self.workSheet['sheetDimensions'] = dict()
+
+        overlap = min(tailRows, len(df))
+        chunks = list(self.iterSheetChunks(sheetName, chunkSize, list(df.columns), len(df) - overlap))
+        fresh = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=df.columns)
+        if len(fresh) < overlap or _frameFingerprint(fresh.iloc[:overlap]) != _frameFingerprint(df.iloc[len(df) - overlap:]):
+            return None
+        return fresh.iloc[overlap:].reset_index(drop=True)
+
     def saveFile(self, filePath, data):
         with open(filePath, 'wb') as file:
             dill.dump(data, file)
 
     def loadFile(self, filePath):
         with open(filePath, 'rb') as file:
-            self.workSheet = dill.load(file)
+            saved = dill.load(file)
+        # Older pickles predate the file path, format and sheet size keys.
+        workSheet = self.newWorkSheet()
+        workSheet.update(saved)
+        if workSheet['filePath'] is None and isinstance(getattr(workSheet['excel'], 'io', None), str):
+            workSheet['filePath'] = workSheet['excel'].io
+        workSheet.setdefault('sourceKey', None)
+        self.ingestedSheets = dict()
+        self.workSheet = workSheet
+
+    def frameKey(self, df):
+        '''Content hash of a DataFrame, remembered for as long as the frame is alive.'''
+        entry = self.frameKeys.get(id(df))
+        if entry is not None and entry[0]() is df:
+            return entry[1]
+        digest = hashlib.sha1()
+        digest.update(repr([(str(eachColumn), str(eachDataType)) for eachColumn, eachDataType in df.dtypes.items()]).encode('utf-8'))
+        digest.update(repr(list(df.index.names)).encode('utf-8'))
+        try:
+            digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        except (TypeError, ValueError):
+            digest.update(dill.dumps(df))
+        key = digest.hexdigest()
+        self.frameKeys[id(df)] = (weakref.ref(df, lambda _, frameId=id(df): self.frameKeys.pop(frameId, None)), key)
+        return key
+
+    def saveFrame(self, df, directory, codec=None, level=None):
+        '''Write df to directory under its content hash and codec unless it is already there; return its manifest entry.'''
+        # The default level only belongs to the default codec; uncompressed and lz4 take none.
+        if codec is None:
+            codec = self.projectCodec
+            level = self.projectCodecLevel if level is None else level
+        key = self.frameKey(df)
+        # The codec is part of the blob name, so a blob already stored with another codec is
+        # not mistaken for this one and the manifest records how its blob was written.
+        entry = {'key': key, 'index': None, 'format': 'feather', 'codec': codec,
+                 'blob': '{0}.{1}.feather'.format(key, codec), 'columns': [str(eachColumn) for eachColumn in df.columns]}
+        frame = df
+        if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+            # Index levels travel as ordinary columns under reserved names.
+            entry['index'] = list(df.index.names)
+            frame = df.rename_axis(['__index_{0}__'.format(level) for level in range(df.index.nlevels)]).reset_index()
+
+        blobPath = path.join(directory, entry['blob'])
+        if path.exists(blobPath):
+            return entry
+
+        tmpPath = '{0}.{1}-{2}.tmp'.format(blobPath, os.getpid(), get_ident())
+        try:
+            if not all(isinstance(eachColumn, str) for eachColumn in frame.columns):
+                raise TypeError('Feather needs string column names.')
+            table = pa.Table.from_pandas(frame)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError):
+            # Columns Arrow cannot type (mixed objects) fall back to a pickled blob.
+            picklePath = path.join(directory, key + '.pkl')
+            entry.update({'format': 'pickle', 'codec': None, 'blob': key + '.pkl'})
+            if not path.exists(picklePath):
+                with open(tmpPath, 'wb') as file:
+                    dill.dump(df, file)
+                os.replace(tmpPath, picklePath)
+            return entry
+        # A codec or level Arrow rejects is the caller's mistake, not the frame's, and is raised.
+        try:
+            feather.write_feather(table, tmpPath, compression=codec, compression_level=level)
+            os.replace(tmpPath, blobPath)
+        finally:
+            if path.exists(tmpPath):
+                os.remove(tmpPath)
+        return entry
+
+    def blobName(self, entry):
+        '''File name of the blob of a manifest entry; entries written before codecs were named carry none.'''
+        return entry.get('blob', entry['key'] + ('.pkl' if entry['format'] == 'pickle' else '.feather'))
+
+    def loadFrame(self, entry, directory):
+        '''Read a DataFrame saved by saveFrame.'''
+        if entry['format'] == 'pickle':
+            with open(path.join(directory, self.blobName(entry)), 'rb') as file:
+                return dill.load(file)
+        df = feather.read_table(path.join(directory, self.blobName(entry))).to_pandas()
+        if entry['index'] is not None:
+            levels = ['__index_{0}__'.format(level) for level in range(len(entry['index']))]
+            df = df.set_index(levels).rename_axis(entry['index'])
+        return df
+
+    def saveProject(self, filePath, workSheet=None, codec=None, level=None, blobCodecs=None):
+        '''Save a work sheet as a small JSON manifest referencing columnar blobs in the shared blob store.
+
+        codec and level apply to every blob of the project unless blobCodecs maps a frame
+        name ('df', 'grouped.df', 'grouped.filterGrouped') to its own (codec, level).
+        '''
+        workSheet = self.workSheet if workSheet is None else workSheet
+        if codec is None:
+            codec = self.projectCodec
+            level = self.projectCodecLevel if level is None else level
+        blobCodecs = blobCodecs or dict()
+        directory = self.blobStore.blobDirectory
+        os.makedirs(directory, exist_ok=True)
+
+        grouped = workSheet.get('grouped', dict())
+        frames = dict()
+        for eachName in ('df', 'filterGrouped'):
+            if isinstance(grouped.get(eachName), pd.DataFrame):
+                frames['grouped.' + eachName] = grouped[eachName]
+        cube = workSheet.get('cube')
+        if cube is not None:
+            frames['cube.finest'] = cube['finest']
+            cubeManifest = {'dimensions': cube['dimensions'], 'measurements': cube['measurements'],
+                            'lattice': [list(eachNode) for eachNode in cube['lattice']],
+                            'current': cube['sourceKey'] == self.frameSource(workSheet['df'], workSheet)}
+        entries = {eachName: self.saveFrame(frame, directory, *blobCodecs.get(eachName, (codec, level)))
+                   for eachName, frame in frames.items()}
+
+        # A table lazily opened from a project is still complete in its blob, so the blob is
+        # reused rather than the partly loaded frame. A table projected from a sheet keeps
+        # its projection, and the columns it lacks are read from the sheet after reopening.
+        projection = workSheet.get('projection')
+        if projection is not None and projection.get('entry') is not None:
+            entries['df'] = self.copyFrameBlob(projection['entry'], projection['directory'], directory)
+            projection = None
+        else:
+            entries['df'] = self.saveFrame(workSheet['df'], directory, *blobCodecs.get('df', (codec, level)))
+
+        manifest = {'version': 2,
+                    'blobDirectory': directory,
+                    'source': {eachKey: workSheet.get(eachKey) for eachKey in ('filePath', 'format', 'separator', 'sheets', 'sheetName', 'sheetDimensions')},
+                    'state': {eachKey: workSheet.get(eachKey) for eachKey in ('dimensions', 'measurements', 'selectedColumns', 'selectedRows',
+                                                                             'currentSelectedFilter', 'previousCurrentRow')},
+                    'filteredColumns': sorted(str(eachFilter) for eachFilter in workSheet['filteredColumns']),
+                    'groupedQuery': grouped.get('query'),
+                    'groupedFilters': [[eachColumn, list(excluded)] for eachColumn, excluded in grouped.get('filters', tuple())],
+                    'projection': projection,
+                    'cube': cubeManifest if cube is not None else None,
+                    'frames': entries}
+        manifest['source']['sheets'] = list(manifest['source']['sheets'] or list())
+
+        # The manifest names the content of every blob, so an unchanged one means nothing to write.
+        text = json.dumps(manifest)
+        if self.savedManifests.get(path.abspath(filePath)) == text and path.exists(filePath):
+            return
+        tmpPath = '{0}.{1}-{2}.tmp'.format(filePath, os.getpid(), get_ident())
+        with open(tmpPath, 'w') as file:
+            file.write(text)
+        os.replace(tmpPath, filePath)
+        self.savedManifests[path.abspath(filePath)] = text
+        self.blobStore.register(filePath)
+
+    def snapshotWorkSheet(self):
+        '''Copy the small mutable state of the work sheet, sharing its DataFrames, which are never changed in place.'''
+        snapshot = dict(self.workSheet)
+        for eachKey in ('sheets', 'selectedColumns', 'selectedRows', 'dimensions', 'measurements'):
+            snapshot[eachKey] = list(self.workSheet.get(eachKey) or list())
+        snapshot['filteredColumns'] = set(self.workSheet['filteredColumns'])
+        snapshot['sheetDimensions'] = dict(self.workSheet.get('sheetDimensions') or dict())
+        snapshot['grouped'] = dict(self.workSheet['grouped'])
+        if self.workSheet.get('projection') is not None:
+            snapshot['projection'] = dict(self.workSheet['projection'])
+        return snapshot
+
+    def copyFrameBlob(self, entry, sourceDirectory, directory):
+        '''Make the blob of a manifest entry available in another project directory.'''
+        targetPath = path.join(directory, self.blobName(entry))
+        if not path.exists(targetPath) and path.abspath(sourceDirectory) != path.abspath(directory):
+            try:
+                os.link(path.join(sourceDirectory, self.blobName(entry)), targetPath)
+            except OSError:
+                shutil.copyfile(path.join(sourceDirectory, self.blobName(entry)), targetPath)
+        return entry
+
+    def loadProject(self, filePath):
+        '''Open a project saved by saveProject; its table is memory-mapped and read column by column on use.'''
+        with open(filePath, 'r') as file:
+            manifest = json.load(file)
+        # Version 1 projects kept their blobs in a directory of their own.
+        directory = manifest.get('blobDirectory', filePath + '.d')
+        frames = {eachName: self.loadFrame(entry, directory) for eachName, entry in manifest['frames'].items() if eachName != 'df'}
+
+        workSheet = {'excel': None}
+        workSheet.update(manifest['source'])
+        workSheet.update(manifest['state'])
+        entry = manifest['frames']['df']
+        workSheet['projection'] = manifest.get('projection')
+        # The blob key identifies the rows the project was saved with, whatever became of its source since.
+        workSheet['sourceKey'] = entry['key']
+        if workSheet['projection'] is None and entry['format'] == 'feather' and entry['index'] is None:
+            workSheet['df'] = pd.DataFrame()
+            workSheet['projection'] = {'columns': entry['columns'], 'entry': entry, 'directory': directory}
+        else:
+            workSheet['df'] = self.loadFrame(entry, directory)
+        workSheet['filteredColumns'] = set(manifest['filteredColumns'])
+        # Filter values are listed again from the table as they are asked for; older
+        # manifests that still carry them are not read.
+        workSheet['columnsValue'] = dict()
+        groupedDF = frames.get('grouped.df', pd.DataFrame())
+        workSheet['grouped'] = {'df': groupedDF, 'columns': list(),
+                                'filterGrouped': frames.get('grouped.filterGrouped', groupedDF), 'graph': tuple()}
+        if manifest['groupedQuery'] is not None:
+            workSheet['grouped']['query'] = (list(manifest['groupedQuery'][0]), manifest['groupedQuery'][1])
+            workSheet['grouped']['filters'] = tuple((eachColumn, tuple(excluded)) for eachColumn, excluded in manifest.get('groupedFilters', list()))
+        workSheet['cube'] = None
+        if manifest.get('cube') is not None:
+            cube = manifest['cube']
+            # Nodes are derived again from the finest grouping as they are asked for.
+            workSheet['cube'] = {'dimensions': cube['dimensions'], 'measurements': cube['measurements'],
+                                 'lattice': [tuple(eachNode) for eachNode in cube['lattice']],
+                                 'sourceKey': workSheet['sourceKey'] if cube['current'] else None,
+                                 'finest': frames['cube.finest'], 'nodes': dict()}
+
+        self.ingestedSheets = dict()
+        self.workSheet = workSheet
 
     def isFileExist(self, filePath):
         '''Check whether file exist.'''
@@ -90,8 +1286,25 @@ class FileManagement:
         writer.save()
 
 class DataOrganization(FileManagement):
+    outOfCore = False
+    outOfCoreChunkSize = 200000
+    # How partial results of each aggregation combine; mean is rebuilt from sum and count.
+    combiners = {'sum': 'sum', 'count': 'sum', 'size': 'sum', 'min': 'min', 'max': 'max'}
+    aggregationCacheBytes = 256 * 1024 ** 2
+    cubeMaxDimensions = 6
+    cubeSampleRows = 1000
+    cubeMaxGroupRatio = 0.1
+    parallelRows = 2000000
+    parallelProcesses = None
+    bitmapFilterValues = 64
+
     def __init__(self):
         super(DataOrganization, self).__init__()
+        self.aggregationCache = AggregationCache(self.aggregationCacheBytes)
+        self.pool = None
+        self.poolProcesses = None
+        self.postings = dict()
+        self.codeStore = {'source': None, 'columns': dict(), 'bitmaps': dict(), 'text': dict(), 'masks': dict()}
 
     def addColumns(self, selectedColumn):
         if 'selectedColumns' in self.workSheet:
@@ -106,51 +1319,820 @@ class DataOrganization(FileManagement):
         else:
             self.workSheet['selectedRows'] = [selectedRows]
 
-    def classifyDimensionMeasurement(self, df):
-        '''Classify dimension and measurement.'''
+    def getColumnsType(self, df):
+        '''Split the columns of df into dimensions and measurements.'''
         columnsType = {'dimensions':[], 'measurements':[]}
 
         for eachColumn, eachDataType in zip(df.columns, df.dtypes):
-            if eachDataType != 'float64':
+            if not pd.api.types.is_float_dtype(eachDataType):
                 columnsType['dimensions'].append(eachColumn)
             else:
                 columnsType['measurements'].append(eachColumn)
+        return columnsType
 
+    def classifyDimensionMeasurement(self, df):
+        '''Classify dimension and measurement.'''
+        columnsType = self.getColumnsType(df)
         self.workSheet['dimensions'] = columnsType['dimensions']
         self.workSheet['measurements'] = columnsType['measurements']
 
     def _isDiscrete(self, measurement):
         '''Check whether measurement is discrete value.'''
-        return self.workSheet['df'][measurement].dtypes != 'float64'
+        if measurement not in self.workSheet['df'].columns:
+            # Not loaded (out-of-core or projected): fall back to the load-time classification.
+            return measurement not in self.workSheet['measurements']
+        return not pd.api.types.is_float_dtype(self.workSheet['df'][measurement].dtypes)
+
+    def levelValues(self, index, level):
+        '''Sorted distinct values of one level of index, read from its codes rather than its tuples.'''
+        if not isinstance(index, pd.MultiIndex):
+            return self.uniqueValues(index.to_series())
+        codes = index.codes[level]
+        uniques = self.uniqueValues(pd.Series(index.levels[level].take(np.unique(codes[codes >= 0]))))
+        if (codes < 0).any():
+            uniques.append(np.nan)
+        return uniques
+
+    def levelMask(self, index, indexName, indexValue):
+        '''Boolean mask of the entries of index whose indexName level equals indexValue.'''
+        if not isinstance(index, pd.MultiIndex):
+            return np.asarray(index == indexValue)
+        level = list(index.names).index(indexName)
+        position = index.levels[level].get_indexer([indexValue])[0]
+        if position < 0:
+            return np.zeros(len(index), dtype=bool)
+        return index.codes[level] == position
 
     def getGroupValue(self, groupedDF):
         self.workSheet['grouped']['columns'] = {}
-        groupedIndex = np.array([*groupedDF.index.values])
-        for indexNum, eachIndexName in enumerate(self.workSheet['grouped']['df'].index.names):
-            self.workSheet['grouped']['columns'][eachIndexName] = list(np.unique(groupedIndex[:, indexNum]))
+        for indexNum, eachIndexName in enumerate(groupedDF.index.names):
+            self.workSheet['grouped']['columns'][eachIndexName] = self.levelValues(groupedDF.index, indexNum)
+
+    def uniqueValues(self, series):
+        '''Sorted unique values of a column, missing values last; mixed-type columns keep first-seen order.'''
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            uniques = list(series.cat.categories[np.unique(codes[codes >= 0])])
+        else:
+            values = np.array(series.dropna())
+            try:
+                uniques = list(np.unique(values))
+            except TypeError:
+                uniques = list(pd.unique(values))
+        if series.hasnans:
+            uniques.append(np.nan)
+        return uniques
+
+    def columnCodes(self, column):
+        '''Integer codes of a column of the work sheet table and the sorted values they stand for, factorized once per table.'''
+        source = self.frameSource(self.workSheet['df'])
+        if self.codeStore['source'] != source:
+            self.codeStore = {'source': source, 'columns': dict(), 'bitmaps': dict(), 'text': dict(), 'masks': dict()}
+        entry = self.codeStore['columns'].get(column)
+        if self.isOutOfCore() and column not in self.workSheet['df'].columns:
+            if entry is None:
+                entry = self.streamColumnCodes(column)
+                self.codeStore['columns'][column] = entry
+            return entry
+        df = self.materializeColumns([column])
+        if entry is None or len(entry[0]) != len(df):
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                entry = (series.cat.codes.to_numpy(), pd.CategoricalIndex(series.cat.categories, dtype=series.dtype))
+            else:
+                # Raises TypeError for mixed values that do not sort; callers then fall back to pandas.
+                entry = pd.factorize(series, sort=True)
+            self.codeStore['columns'][column] = entry
+        return entry
+
+    def isOutOfCore(self):
+        '''Whether the work sheet table stays empty and its sheet is read chunk by chunk instead.'''
+        return self.outOfCore and self.workSheet.get('projection') is not None and self.workSheet.get('sheetName') is not None
+
+    def streamColumnCodes(self, column):
+        '''Codes and sorted values of one column of an out-of-core sheet, as pd.factorize would give them, read chunk by chunk.'''
+        chunkCodes = list()
+        chunkValues = list()
+        for chunk in self.iterSheetChunks(self.workSheet['sheetName'], self.outOfCoreChunkSize, [column]):
+            series = chunk[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype(series.cat.categories.dtype)
+            # Raises TypeError for mixed values that do not sort, as columnCodes does.
+            codes, values = pd.factorize(series, sort=True)
+            chunkCodes.append(codes)
+            chunkValues.append(pd.Series(values))
+        if not chunkCodes:
+            return np.array([], dtype=np.intp), pd.Index([])
+        # Number each chunk's values again among those of every chunk; -1 stays missing.
+        slots, uniques = pd.factorize(pd.concat(chunkValues, ignore_index=True), sort=True)
+        lookup = np.append(slots, -1)
+        offsets = np.cumsum([0] + [len(values) for values in chunkValues])
+        codes = np.concatenate([lookup[np.where(eachCodes < 0, len(slots), offset + eachCodes)]
+                                for eachCodes, offset in zip(chunkCodes, offsets)])
+        return codes, uniques
+
+    def streamUniqueValues(self, column):
+        '''Unique values of one column of an out-of-core sheet, as uniqueValues gives them, read chunk by chunk.'''
+        values = None
+        for chunk in self.iterSheetChunks(self.workSheet['sheetName'], self.outOfCoreChunkSize, [column]):
+            distinct = chunk[column].drop_duplicates()
+            values = distinct if values is None else pd.concat([values, distinct], ignore_index=True).drop_duplicates()
+        if values is None:
+            return list()
+        return self.uniqueValues(values)
+
+    def streamRows(self, select):
+        '''The rows select(chunk) keeps of each chunk of an out-of-core sheet, which are all the memory it takes.'''
+        chunks = [select(chunk) for chunk in self.iterSheetChunks(self.workSheet['sheetName'], self.outOfCoreChunkSize)]
+        if not chunks:
+            return pd.DataFrame(columns=self.workSheet['projection']['columns'])
+        return pd.concat(chunks, ignore_index=True)
 
     def getColumnValue(self, column):
-        values = np.array(self.workSheet['df'][column])
-        self.workSheet['columnsValue'][column] = list(np.unique(values))
+        if self.isOutOfCore() and column not in self.workSheet['df'].columns:
+            # Only the distinct values are held, never the column.
+            self.workSheet['columnsValue'][column] = self.streamUniqueValues(column)
+            return
+        try:
+            codes, uniques = self.columnCodes(column)
+        except TypeError:
+            self.workSheet['columnsValue'][column] = self.uniqueValues(self.workSheet['df'][column])
+            return
+        values = list(uniques.take(np.unique(codes[codes >= 0])))
+        if (codes < 0).any():
+            values.append(np.nan)
+        self.workSheet['columnsValue'][column] = values
+
+    def getColumnValues(self, column):
+        '''Unique values of column, extracted on first use.'''
+        if column not in self.workSheet['columnsValue']:
+            self.getColumnValue(column)
+        return self.workSheet['columnsValue'][column]
 
     def filterByColumns(self, df, filterBy, filterValue):
+        if df is self.workSheet['df'] and self.isOutOfCore():
+            if pd.isna(filterValue):
+                return self.streamRows(lambda chunk: chunk.loc[chunk[filterBy].isna()])
+            return self.streamRows(lambda chunk: chunk.loc[chunk[filterBy] == filterValue])
+        if df is self.workSheet['df']:
+            try:
+                index = self.bitmapIndex(filterBy)
+            except TypeError:
+                df = self.materializeColumns([filterBy])
+            else:
+                position = self.columnCodes(filterBy)[1].get_indexer([filterValue])[0]
+                # -1 is both the code of missing values and what an absent value looks up to.
+                if position < 0 and not pd.isna(filterValue):
+                    return self.workSheet['df'].iloc[:0]
+                kind, rows = index['values'].get(position, ('rows', np.array([], dtype=np.int32)))
+                if kind == 'rows':
+                    return self.workSheet['df'].iloc[rows]
+                return self.workSheet['df'].loc[np.unpackbits(rows, count=index['rows']).view(bool)]
         return df.loc[df[filterBy] == filterValue]
 
-    def filterByIndex(self, groupedDF, filterValue):
-        self.workSheet['grouped']['filterGrouped'] = groupedDF.filter(like=filterValue, axis=0)
+    def bitmapIndex(self, column):
+        '''Bitmap index of a column of the work sheet table, built on first use: each value code to the rows holding it.'''
+        codes, uniques = self.columnCodes(column)
+        index = self.codeStore['bitmaps'].get(column)
+        if index is not None and index['codes'] is codes:
+            return index
+
+        # Common values get a packed bitmap of every row; rare ones, whose row numbers
+        # take less room than a bitmap, keep a sorted array of their rows instead.
+        rowType = np.int32 if len(codes) < 2 ** 31 else np.int64
+        threshold = len(codes) / (8 * np.dtype(rowType).itemsize)
+        counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+        order = np.argsort(codes, kind='stable').astype(rowType)
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        values = dict()
+        for slot in np.flatnonzero(counts):
+            if counts[slot] > threshold:
+                values[slot - 1] = ('bits', np.packbits(codes == slot - 1))
+            else:
+                values[slot - 1] = ('rows', order[bounds[slot]:bounds[slot + 1]])
+        index = {'codes': codes, 'rows': len(codes), 'values': values}
+        self.codeStore['bitmaps'][column] = index
+        return index
+
+    def valueText(self, column):
+        '''The code of each value of a column of the work sheet table by its text, as filter lists show it.'''
+        codes, uniques = self.columnCodes(column)
+        entry = self.codeStore['text'].get(column)
+        if entry is None or entry[0] is not codes:
+            text = {str(value): code for code, value in enumerate(uniques)}
+            text[str(np.nan)] = -1
+            entry = (codes, text)
+            self.codeStore['text'][column] = entry
+        return entry[1]
+
+    def valuesBitmap(self, column, valueCodes):
+        '''Packed bitmap of the rows of the work sheet table holding any of the value codes of column.'''
+        index = self.bitmapIndex(column)
+        bitmap = np.zeros((index['rows'] + 7) // 8, dtype=np.uint8)
+        rows = list()
+        for eachCode in valueCodes:
+            kind, data = index['values'].get(eachCode, ('rows', None))
+            if kind == 'bits':
+                bitmap |= data
+            elif data is not None:
+                rows.append(data)
+        if rows:
+            rows = np.concatenate(rows)
+            if len(rows) * 64 > index['rows']:
+                # Many rare values: setting bytes and packing once beats setting bits one by one.
+                mask = np.zeros(index['rows'], dtype=bool)
+                mask[rows] = True
+                bitmap |= np.packbits(mask)
+            else:
+                np.bitwise_or.at(bitmap, rows >> 3, np.right_shift(128, rows & 7).astype(np.uint8))
+        return bitmap
+
+    def levelPostings(self, groupedDF, level):
+        '''Hash index of one level of a grouped result: each value, and its text, to the positions holding it.'''
+        entry = self.postings.get(id(groupedDF))
+        if entry is None or entry[0]() is not groupedDF:
+            entry = (weakref.ref(groupedDF, lambda _, frameId=id(groupedDF): self.postings.pop(frameId, None)), dict())
+            self.postings[id(groupedDF)] = entry
+        if level not in entry[1]:
+            index = groupedDF.index
+            if isinstance(index, pd.MultiIndex):
+                codes, values = index.codes[level], index.levels[level]
+            else:
+                codes, values = pd.factorize(index)
+            order = np.argsort(codes, kind='stable')
+            sortedCodes = codes[order]
+            starts = np.searchsorted(sortedCodes, np.arange(len(values)))
+            stops = np.searchsorted(sortedCodes, np.arange(len(values)), side='right')
+            postings = dict()
+            for value, start, stop in zip(values, starts, stops):
+                if stop > start:
+                    postings[value] = order[start:stop]
+            # Filter lists hold the text of values, so match that as well.
+            for value in list(postings):
+                postings.setdefault(str(value), postings[value])
+            entry[1][level] = postings
+        return entry[1][level]
+
+    def filterByIndex(self, groupedDF, filterValue, indexName=None):
+        '''Keep the groups whose indexName level, or any level, equals filterValue or one of a list of values.'''
+        values = list(filterValue) if isinstance(filterValue, (list, tuple, set, frozenset)) else [filterValue]
+        levels = range(groupedDF.index.nlevels) if indexName is None else [list(groupedDF.index.names).index(indexName)]
+        matches = list()
+        for eachLevel in levels:
+            postings = self.levelPostings(groupedDF, eachLevel)
+            matches.extend(postings[value] for value in values if value in postings)
+        positions = np.unique(np.concatenate(matches)) if matches else np.array([], dtype=np.intp)
+        self.workSheet['grouped']['filterGrouped'] = groupedDF.iloc[positions]
 
     def filterGrouped(self, filterGrouped, indexName, indexValue):
-        index = list(filterGrouped.index.names).index(indexName)
-        boolArray = np.array([*filterGrouped.index.values])[:, index] == indexValue
-        dfIndex = filterGrouped.index.values[boolArray]
-        self.workSheet['grouped']['filterGrouped'] = filterGrouped.filter(items=dfIndex, axis=0)
-
-    def groupData(self, df, dimensions, measurement):
+        self.workSheet['grouped']['filterGrouped'] = filterGrouped.loc[self.levelMask(filterGrouped.index, indexName, indexValue)]
+
+    def activeFilters(self):
+        '''The unchecked values of every column and row in use, as a hashable (column, values) tuple.'''
+        filters = list()
+        if not self.workSheet['filteredColumns']:
+            return tuple()
+        for eachColumn in dict.fromkeys(list(self.workSheet['selectedColumns']) + list(self.workSheet['selectedRows'])):
+            values = [str(value) for value in self.getColumnValues(eachColumn)]
+            excluded = sorted(value for value in values if value in self.workSheet['filteredColumns'])
+            if excluded:
+                filters.append((eachColumn, tuple(excluded)))
+        return tuple(filters)
+
+    def applyFilters(self, df, filters):
+        '''Drop the rows of df holding an excluded value of any filtered column.'''
+        for eachColumn, excluded in filters or tuple():
+            keep = ~df[eachColumn].astype(str).isin(excluded)
+            if str(np.nan) in excluded:
+                # Filter lists show missing values as 'nan', which text conversion may not produce.
+                keep &= df[eachColumn].notna()
+            df = df.loc[keep]
+        return df
+
+    def columnFilterBitmap(self, column, excluded):
+        '''Packed bitmap of the rows whose value of column is not excluded, remembered until that column's filter changes.'''
+        codes, uniques = self.columnCodes(column)
+        excluded = tuple(excluded)
+        entry = self.codeStore['masks'].get(column)
+        if entry is not None and entry[0] is codes and entry[1] == excluded:
+            return entry[2]
+
+        text = self.valueText(column)
+        excludedCodes = [text[value] for value in excluded if value in text]
+        if len(excludedCodes) <= self.bitmapFilterValues:
+            bitmap = ~self.valuesBitmap(column, excludedCodes)
+        else:
+            # Many values unchecked: one lookup-table pass over the codes, missing values in slot 0.
+            table = np.zeros(len(uniques) + 1, dtype=bool)
+            table[np.array(excludedCodes) + 1] = True
+            bitmap = np.packbits(~table[codes + 1])
+        self.codeStore['masks'][column] = (codes, excluded, bitmap)
+        return bitmap
+
+    def filterBitmap(self, filters):
+        '''Packed bitmap of the rows of the work sheet table that the filters keep.'''
+        bitmap = np.full((len(self.workSheet['df']) + 7) // 8, 255, dtype=np.uint8)
+        for eachColumn, excluded in filters or tuple():
+            bitmap &= self.columnFilterBitmap(eachColumn, excluded)
+        return bitmap
+
+    def filterMask(self, filters):
+        '''Boolean mask of the rows of the work sheet table that the filters keep, computed on bitmap indexes.'''
+        if not filters:
+            return np.ones(len(self.workSheet['df']), dtype=bool)
+        return np.unpackbits(self.filterBitmap(filters), count=len(self.workSheet['df'])).view(bool)
+
+    def filteredFrame(self):
+        '''The rows of the work sheet table that the checkbox filters currently keep.'''
+        filters = self.activeFilters()
+        if self.isOutOfCore():
+            return self.streamRows(lambda chunk: self.applyFilters(chunk, filters))
+        if not filters:
+            return self.workSheet['df']
+        try:
+            mask = self.filterMask(filters)
+        except TypeError:
+            return self.applyFilters(self.materializeColumns([eachColumn for eachColumn, _ in filters]), filters)
+        return self.workSheet['df'].loc[mask]
+
+    def groupCodes(self, dimensions, measurement, filters=None, sumBins=None):
+        '''Group the work sheet table on its cached dimension codes; return the result and its null dimensions, or None. sumBins collects the bins of exact sums.'''
+        # None when a column does not factorize or the combined key would overflow,
+        # and pandas groups the values instead.
+        try:
+            columnCodes = [self.columnCodes(eachDimension) for eachDimension in dimensions]
+            mask = self.filterMask(filters)
+        except TypeError:
+            return None
+        sizes = [max(len(uniques), 1) for _, uniques in columnCodes]
+        if np.prod(np.array(sizes, dtype=float)) >= 2 ** 62:
+            return None
+
+        # Mixed-radix key: ordering keys orders rows by each dimension in turn, as pandas does.
+        key = np.zeros(len(mask), dtype=np.int64)
+        valid = mask.copy()
+        nullDimensions = set()
+        for eachDimension, (codes, _), size in zip(dimensions, columnCodes, sizes):
+            missing = codes < 0
+            if (missing & mask).any():
+                nullDimensions.add(eachDimension)
+            valid &= ~missing
+            key = key * size + codes
+
+        frame = self.materializeColumns(self.measuredColumns(measurement))[self.measuredColumns(measurement)].loc[valid]
+        key = key[valid]
+        keySpace = int(np.prod(np.array(sizes, dtype=float)))
+        discrete = not isinstance(measurement, (list, tuple)) and self._isDiscrete(measurement)
+        processes = self.parallelProcesses or cpu_count()
+        keyBins = dict()
+        if (len(key) >= self.parallelRows and processes > 1 and self.isCombinable(self.partialMeasurement(measurement))
+                and all(isinstance(eachType, np.dtype) for eachType in frame.dtypes)):
+            groupKeys, grouped = self.reduceKeysParallel(key, frame, measurement, discrete, keySpace, processes, keyBins)
+        else:
+            groupKeys, grouped = _reduceKeys(key, frame, measurement, discrete, keySpace, keyBins)
+
+        levelCodes = list()
+        for size in reversed(sizes):
+            levelCodes.insert(0, groupKeys % size)
+            groupKeys = groupKeys // size
+        if len(dimensions) == 1:
+            grouped.index = columnCodes[0][1].take(levelCodes[0]).rename(dimensions[0])
+        else:
+            grouped.index = pd.MultiIndex(levels=[uniques for _, uniques in columnCodes], codes=levelCodes, names=list(dimensions))
+        if sumBins is not None:
+            sumBins.update({eachMeasurement: bins.set_axis(grouped.index) for eachMeasurement, bins in keyBins.items()})
+        return grouped, nullDimensions
+
+    def reducePool(self, processes):
+        '''Worker pool for parallel reductions, started on first use and kept for the queries after.'''
+        if self.pool is not None and self.poolProcesses != processes:
+            self.closePool()
+        if self.pool is None:
+            self.pool = Pool(processes)
+            self.poolProcesses = processes
+            atexit.register(self.closePool)
+        return self.pool
+
+    def closePool(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+            atexit.unregister(self.closePool)
+
+    def reduceKeysParallel(self, key, frame, measurement, discrete, keySpace, processes, sumBins=None):
+        '''Reduce rows by group key across a process pool, each worker taking a contiguous range of rows.'''
+        # Every worker reads only its own rows; their partial results combine group by
+        # group, float sums through their exact bins, so the result is the serial one.
+        partialMeasurement = self.partialMeasurement(measurement)
+        bounds = np.linspace(0, len(key), processes + 1).astype(np.int64)
+        blocks = list()
+        try:
+            specs = list()
+            for eachName, array in [(None, key)] + [(eachColumn, frame[eachColumn].to_numpy()) for eachColumn in frame.columns]:
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                specs.append((eachName, (block.name, array.shape, array.dtype.str)))
+            tasks = [(specs[0][1], specs[1:], start, stop, partialMeasurement, discrete, keySpace)
+                     for start, stop in zip(bounds[:-1], bounds[1:])]
+            partials = self.reducePool(processes).map(_reduceRangeWorker, tasks)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        grouped = self.combinePartials([eachPartial.set_axis(pd.Index(eachKeys)) for eachKeys, eachPartial, _ in partials],
+                                       [0], partialMeasurement)
+        partialBins = {eachMeasurement: _combineSumBins([eachBins[eachMeasurement].set_axis(pd.Index(eachKeys))
+                                                         for eachKeys, _, eachBins in partials], [0])
+                       for eachMeasurement in partials[0][2]}
+        grouped = self.finishPartials(self.finishSums(grouped, partialMeasurement, partialBins), measurement, partialMeasurement)
+        if sumBins is not None:
+            sumBins.update({eachMeasurement: bins.reindex(grouped.index, fill_value=0).reset_index(drop=True)
+                            for eachMeasurement, bins in partialBins.items()})
+        return grouped.index.to_numpy().astype(np.int64), grouped.reset_index(drop=True)
+
+    def frameSource(self, df, workSheet=None):
+        '''Identity of the rows of df: where the work sheet table came from, or a hash of any other table.'''
+        workSheet = self.workSheet if workSheet is None else workSheet
+        source = workSheet.get('sourceKey') if df is workSheet['df'] else None
+        projection = workSheet.get('projection') or dict()
+        if df is workSheet['df'] and projection.get('entry') is not None:
+            source = projection['entry']['key']
+        if source is None:
+            # Not the loaded sheet, or a table without a source: hash its contents.
+            source = self.frameKey(df)
+        return source
+
+    def aggregationKey(self, df, dimensions, measurement, filters):
+        '''Cache key of an aggregation: what rows it read, and how it grouped and reduced them.'''
+        source = self.frameSource(df)
+        if isinstance(measurement, (list, tuple)):
+            measurement, aggregation = tuple(tuple(eachPair) for eachPair in measurement), 'pairs'
+        else:
+            aggregation = 'size' if self._isDiscrete(measurement) else 'sum'
+        return (source, self.workSheet.get('sheetName'), tuple(dimensions), measurement, aggregation, tuple(filters or tuple()))
+
+    def measuredColumns(self, measurement):
+        '''The columns an aggregation of measurement, a column or a list of (measurement, aggregation) pairs, reads.'''
+        if isinstance(measurement, (list, tuple)):
+            return list(dict.fromkeys(eachMeasurement for eachMeasurement, _ in measurement))
+        return [measurement]
+
+    def aggregateMany(self, df, dimensions, pairs, sumBins=None):
+        '''Reduce every (measurement, aggregation) pair per group of dimensions, grouping the rows only once.'''
+        return _aggregatePairs(df, dimensions, pairs, sumBins)
+
+    def aggregate(self, df, dimensions, measurement, sumBins=None):
+        '''Sum a continuous measurement, or count rows for a discrete one, per group of dimensions; sumBins collects the bins of exact sums.'''
+        if isinstance(measurement, (list, tuple)):
+            return self.aggregateMany(df, dimensions, measurement, sumBins)
         if not self._isDiscrete(measurement):
-            self.workSheet['grouped'] = {'df':pd.DataFrame(df.groupby(dimensions)[[measurement]].sum())}
+            return self.aggregateMany(df, dimensions, [(measurement, 'sum')], sumBins).set_axis([measurement], axis=1)
+        return pd.DataFrame(df.groupby(dimensions, observed=True).size(), columns=['Amount'])
+
+    def finishSums(self, grouped, measurement, sumBins):
+        '''Set the sums of measurement in grouped, a combination of partial results, to the exact totals of their bins.'''
+        for eachMeasurement, bins in sumBins.items():
+            column = eachMeasurement if not isinstance(measurement, (list, tuple)) else (eachMeasurement, 'sum')
+            if column in grouped.columns and pd.api.types.is_float_dtype(grouped[column].dtype):
+                grouped[column] = _finishSums(bins.reindex(grouped.index, fill_value=0))
+        return grouped
+
+    def isCombinable(self, measurement):
+        '''Whether partial results of measurement can be merged into the result over all their rows.'''
+        if not isinstance(measurement, (list, tuple)):
+            return True
+        return all(eachAggregation in self.combiners for _, eachAggregation in measurement)
+
+    def partialCombiners(self, grouped, measurement):
+        '''How to combine each column of partial results of measurement, or None if some aggregation does not combine.'''
+        if not isinstance(measurement, (list, tuple)):
+            # Sums and counts add up.
+            return {eachColumn: 'sum' for eachColumn in grouped.columns}
+        if not self.isCombinable(measurement):
+            return None
+        return {eachColumn: self.combiners[eachColumn[1]] for eachColumn in grouped.columns}
+
+    def combinePartials(self, partials, levels, measurement):
+        '''Merge partial results of measurement group by group.'''
+        combiners = self.partialCombiners(partials[0], measurement)
+        stacked = pd.concat(partials)
+        if not isinstance(measurement, (list, tuple)):
+            return stacked.groupby(level=levels, observed=True).sum()
+        return stacked.groupby(level=levels, observed=True).agg(combiners)[list(partials[0].columns)]
+
+    def rollUp(self, finer, dimensions, measurement=None):
+        '''Re-aggregate a finer grouping over a subset of its dimensions; see isCombinable.'''
+        return self.combinePartials([finer], list(dimensions), measurement)
+
+    def nullDimensions(self, df, dimensions):
+        '''The dimensions of df with missing values, whose rows grouping drops.'''
+        return frozenset(eachDimension for eachDimension in dimensions if df[eachDimension].hasnans)
+
+    def cubeDimensions(self):
+        '''Default cube dimensions: the classified dimensions with the fewest distinct values, leaving out id-like ones.'''
+        df = self.workSheet['df']
+        unloaded = [eachColumn for eachColumn in self.workSheet['dimensions'] if eachColumn not in df.columns]
+        sample = None
+        if unloaded:
+            # Projected or out-of-core: judge the columns not read yet from the first rows.
+            projection = self.workSheet.get('projection') or dict()
+            if projection.get('entry') is not None:
+                sample = self.loadProjectedColumns(unloaded).head(self.cubeSampleRows)
+            else:
+                sample = self.sampleSheet(self.workSheet['sheetName'], self.cubeSampleRows)
+        cardinality = dict()
+        for eachColumn in self.workSheet['dimensions']:
+            if eachColumn in df.columns:
+                values = self.workSheet['columnsValue'].get(eachColumn)
+                distinct = len(values) if values is not None else df[eachColumn].nunique(dropna=False)
+                rows = len(df)
+            else:
+                distinct, rows = sample[eachColumn].nunique(dropna=False), len(sample)
+            # About one value per row, as ids and timestamps have, summarizes nothing.
+            if distinct <= self.categoryRatio * rows:
+                cardinality[eachColumn] = distinct
+        return sorted(cardinality, key=cardinality.get)[:self.cubeMaxDimensions]
+
+    def cubeFinest(self, df, dimensions, measurements):
+        '''Sums of every measurement and the row count per group of all cube dimensions, missing keys kept as groups.'''
+        grouped = df.groupby(dimensions, observed=True, dropna=False)
+        finest = grouped[list(measurements)].sum() if measurements else pd.DataFrame(index=grouped.size().index)
+        finest['__size__'] = grouped.size()
+        # Float sums keep their exact bins as extra columns, so that every grouping of
+        # the lattice comes out as the same query would without the cube.
+        for eachMeasurement in measurements:
+            if pd.api.types.is_float_dtype(df[eachMeasurement].dtype):
+                bins = _groupSumBins(grouped, df[eachMeasurement].to_numpy(dtype=np.float64, na_value=np.nan))
+                for eachBin in bins.columns:
+                    finest['__bin__:{0}:{1}'.format(eachBin, eachMeasurement)] = bins[eachBin].to_numpy()
+        return self.finishCubeSums(finest)
+
+    def plainBinColumns(self, *groupings):
+        '''Bin columns of cube groupings that hold values added as they are.'''
+        return list(dict.fromkeys(eachColumn for eachGrouping in groupings for eachColumn in eachGrouping.columns
+                                  if isinstance(eachColumn, str) and eachColumn.startswith('__bin__:{0}:'.format(_PLAIN_SUM_BIN))))
+
+    def finishCubeSums(self, grouping, dropBins=False):
+        '''Set the float sums of a cube grouping to the exact totals of its bin columns.'''
+        binColumns = dict()
+        for eachColumn in grouping.columns:
+            if isinstance(eachColumn, str) and eachColumn.startswith('__bin__:'):
+                _, eachBin, eachMeasurement = eachColumn.split(':', 2)
+                binColumns.setdefault(eachMeasurement, dict())[int(eachBin)] = eachColumn
+        for eachMeasurement, columns in binColumns.items():
+            bins = grouping[list(columns.values())].set_axis(list(columns), axis=1)
+            grouping[eachMeasurement] = _finishSums(bins)
+        if dropBins:
+            grouping = grouping.drop(columns=[eachColumn for columns in binColumns.values() for eachColumn in columns.values()])
+        return grouping
+
+    def cubeNode(self, cube, nodeDimensions):
+        '''One grouping of the cube lattice, derived from the finest grouping on first use.'''
+        node = cube['nodes'].get(nodeDimensions)
+        if node is None:
+            # Dropping missing keys here matches grouping the rows by these dimensions alone.
+            node = _combineSumBins([cube['finest']], list(nodeDimensions), plainColumns=self.plainBinColumns(cube['finest']))
+            node = self.finishCubeSums(node, dropBins=True)
+            cube['nodes'][nodeDimensions] = node
+        return node
+
+    def buildCube(self, df, dimensions=None, measurements=None, lattice=None):
+        '''Precompute the grouping-set lattice of the cube dimensions, or the configured subset of it; None when it would not be much smaller than the table.'''
+        dimensions = list(dimensions or self.cubeDimensions())
+        if not dimensions:
+            return None
+        measurements = list(self.workSheet['measurements'] if measurements is None else measurements)
+        if lattice is None:
+            lattice = [eachNode for size in range(1, len(dimensions) + 1) for eachNode in combinations(dimensions, size)]
+        else:
+            lattice = [tuple(eachDimension for eachDimension in dimensions if eachDimension in eachNode) for eachNode in lattice]
+        source = self.frameSource(df)
+
+        columns = dimensions + measurements
+        if df is self.workSheet['df'] and not set(columns) <= set(df.columns) and self.workSheet.get('sheetName') is not None:
+            # Projected or out-of-core: build from the sheet chunk by chunk.
+            finest = None
+            for chunk in self.iterSheetChunks(self.workSheet['sheetName'], self.outOfCoreChunkSize, columns):
+                chunkFinest = self.cubeFinest(chunk, dimensions, measurements)
+                if finest is None:
+                    finest = chunkFinest
+                else:
+                    finest = _combineSumBins([finest, chunkFinest], list(range(len(dimensions))), False, self.plainBinColumns(finest, chunkFinest))
+            if finest is not None:
+                finest = self.finishCubeSums(finest)
+        else:
+            finest = self.cubeFinest(df, dimensions, measurements)
+        if finest is None or len(finest) > self.cubeMaxGroupRatio * finest['__size__'].sum():
+            return None
+
+        cube = {'dimensions': dimensions, 'measurements': measurements, 'lattice': lattice,
+                'sourceKey': source, 'finest': finest, 'nodes': dict()}
+        for eachNode in lattice:
+            self.cubeNode(cube, eachNode)
+        return cube
+
+    def lookupCube(self, df, dimensions, measurement, filters):
+        '''Answer a grouping from the cube of the work sheet, or return None if the cube does not cover it.'''
+        cube = self.workSheet.get('cube')
+        if cube is None or filters or df is not self.workSheet['df'] or cube['sourceKey'] != self.frameSource(df):
+            return None
+        if isinstance(measurement, (list, tuple)):
+            return None
+        nodeDimensions = tuple(eachDimension for eachDimension in cube['dimensions'] if eachDimension in dimensions)
+        if len(nodeDimensions) == 0 or len(nodeDimensions) != len(dimensions) or nodeDimensions not in cube['lattice']:
+            return None
+        if self._isDiscrete(measurement):
+            node = self.cubeNode(cube, nodeDimensions)[['__size__']].rename(columns={'__size__': 'Amount'})
+        elif measurement in cube['measurements']:
+            node = self.cubeNode(cube, nodeDimensions)[[measurement]]
         else:
-            self.workSheet['grouped'] = {'df': pd.DataFrame(df.groupby(dimensions).size(), columns=['Amount'])}
-        self.workSheet['grouped']['filterGrouped'] = self.workSheet['grouped']
+            return None
+        if list(dimensions) != list(nodeDimensions):
+            node = node.reorder_levels(list(dimensions)).sort_index()
+        return node
+
+    def partialMeasurement(self, measurement):
+        '''The aggregations partial results of measurement are made of; a mean does not combine, but its sum and count do.'''
+        if not isinstance(measurement, (list, tuple)):
+            return measurement
+        partialMeasurement = list()
+        for eachMeasurement, eachAggregation in measurement:
+            partialMeasurement.extend([(eachMeasurement, 'sum'), (eachMeasurement, 'count')] if eachAggregation == 'mean'
+                                      else [(eachMeasurement, eachAggregation)])
+        return list(dict.fromkeys(tuple(eachPair) for eachPair in partialMeasurement))
+
+    def finishPartials(self, partial, measurement, partialMeasurement):
+        '''Turn combined partial results back into the aggregations of measurement.'''
+        if partialMeasurement is not measurement:
+            for eachMeasurement, eachAggregation in measurement:
+                if eachAggregation == 'mean':
+                    partial[(eachMeasurement, 'mean')] = partial[(eachMeasurement, 'sum')] / partial[(eachMeasurement, 'count')]
+            partial = partial[[tuple(eachPair) for eachPair in measurement]]
+        return partial
+
+    def groupDataChunked(self, chunks, dimensions, measurement, sumBins=None):
+        '''Aggregate a stream of chunks, holding only the running per-group partials in memory; sumBins collects the bins of exact sums.'''
+        partialMeasurement = self.partialMeasurement(measurement)
+
+        partial = None
+        partialBins = dict()
+        for chunk in chunks:
+            chunkBins = dict()
+            chunkGrouped = self.aggregate(chunk, dimensions, partialMeasurement, chunkBins)
+            if partial is None:
+                partial, partialBins = chunkGrouped, chunkBins
+            else:
+                levels = list(range(partial.index.nlevels))
+                partial = self.combinePartials([partial, chunkGrouped], levels, partialMeasurement)
+                # Float sums travel as exact bins, so that they come out as they would in memory.
+                partialBins = {eachMeasurement: _combineSumBins([partialBins[eachMeasurement], bins], levels)
+                               for eachMeasurement, bins in chunkBins.items() if eachMeasurement in partialBins}
+        if partial is None:
+            columns = list(dict.fromkeys(list(dimensions) + self.measuredColumns(measurement)))
+            return self.aggregate(pd.DataFrame(columns=columns), dimensions, measurement)
+        partial = self.finishSums(partial, partialMeasurement, partialBins)
+        if sumBins is not None:
+            sumBins.update(partialBins)
+        return self.finishPartials(partial, measurement, partialMeasurement)
+
+    def groupData(self, df, dimensions, measurement, filters=None):
+        key = self.aggregationKey(df, dimensions, measurement, filters)
+        groupedDF = self.lookupCube(df, dimensions, measurement, filters)
+        if groupedDF is None:
+            groupedDF = self.aggregationCache.get(key)
+        if groupedDF is None and len(dimensions) > 0 and self.isCombinable(measurement):
+            finer = self.aggregationCache.findFiner(key)
+            if finer is not None:
+                finerDF, finerNulls, finerBins = finer
+                sumBins = {eachMeasurement: _combineSumBins([bins], list(dimensions)) for eachMeasurement, bins in finerBins.items()}
+                groupedDF = self.finishSums(self.rollUp(finerDF, dimensions, measurement), measurement, sumBins)
+                # The rows the finer result dropped for a missing key are missing from this one too.
+                self.aggregationCache.put(key, groupedDF, finerNulls & set(dimensions), sumBins)
+        if groupedDF is None:
+            filterColumns = [eachColumn for eachColumn, _ in filters or tuple()]
+            columns = list(dict.fromkeys(list(dimensions) + self.measuredColumns(measurement) + filterColumns))
+            nullDimensions = set()
+            sumBins = dict()
+            if self.outOfCore and df is self.workSheet['df'] and self.workSheet.get('sheetName') is not None:
+                def filteredChunks():
+                    for chunk in self.iterSheetChunks(self.workSheet['sheetName'], self.outOfCoreChunkSize, columns, filters=filters):
+                        chunk = self.applyFilters(chunk, filters)
+                        nullDimensions.update(self.nullDimensions(chunk, dimensions))
+                        yield chunk
+                groupedDF = self.groupDataChunked(filteredChunks(), dimensions, measurement, sumBins)
+            else:
+                groupedCodes = None
+                if df is self.workSheet['df'] and len(dimensions) > 0:
+                    groupedCodes = self.groupCodes(dimensions, measurement, filters, sumBins)
+                if groupedCodes is not None:
+                    groupedDF = groupedCodes[0]
+                    nullDimensions.update(groupedCodes[1])
+                else:
+                    if df is self.workSheet['df']:
+                        df = self.materializeColumns(columns)
+                    df = self.applyFilters(df, filters)
+                    nullDimensions.update(self.nullDimensions(df, dimensions))
+                    groupedDF = self.aggregate(df, dimensions, measurement, sumBins)
+            self.aggregationCache.put(key, groupedDF, nullDimensions, sumBins)
+        self.workSheet['grouped'] = {'df': groupedDF, 'filterGrouped': groupedDF, 'query': (list(dimensions), measurement),
+                                     'filters': tuple(filters or tuple())}
+
+    def refreshSheet(self):
+        '''Append new rows of the current sheet and return their count, or None if it must be reloaded.'''
+        refresh = self.prepareRefresh()
+        if refresh is None:
+            return None
+        return self.applyRefresh(refresh)
+
+    def prepareRefresh(self):
+        '''Read the rows appended to the current sheet and work out the state they lead to without installing it, or None if it must be reloaded.'''
+        workSheet = self.workSheet
+        oldDF = workSheet['df']
+        delta = self.readAppendedRows()
+        if delta is None:
+            return None
+        refresh = {'workSheet': workSheet, 'oldDF': oldDF, 'rows': len(delta)}
+        if len(delta) == 0:
+            return refresh
+
+        cube = workSheet.get('cube')
+        if cube is not None and cube['sourceKey'] != self.frameSource(oldDF, workSheet):
+            cube = None
+        groupedBins = None
+        if 'query' in workSheet['grouped']:
+            dimensions, measurement = workSheet['grouped']['query']
+            groupedBins = self.aggregationCache.sumBins(self.aggregationKey(oldDF, dimensions, measurement,
+                                                                            workSheet['grouped'].get('filters')))
+        df = pd.concat([oldDF, delta], ignore_index=True)
+        if self.compactOnLoad:
+            df = self.compactFrame(df, workSheet['dimensions'])[0]
+        sourceKey = self.sourceKey(workSheet['sheetName'])
+
+        if cube is not None:
+            # The cube is additive too: fold the new rows into its finest grouping.
+            deltaFinest = self.cubeFinest(delta, cube['dimensions'], cube['measurements'])
+            finest = _combineSumBins([cube['finest'], deltaFinest], list(range(len(cube['dimensions']))), False,
+                                     self.plainBinColumns(cube['finest'], deltaFinest))
+            finest = self.finishCubeSums(finest)
+            cube = dict(cube, finest=finest, sourceKey=sourceKey if sourceKey is not None else self.frameKey(df), nodes=dict())
+            for eachNode in cube['lattice']:
+                self.cubeNode(cube, eachNode)
+
+        columnsValue = {eachColumn: self.uniqueValues(pd.Series(values + self.uniqueValues(delta[eachColumn]), dtype=object))
+                        for eachColumn, values in workSheet['columnsValue'].items()}
+
+        grouped = None
+        if 'query' in workSheet['grouped']:
+            dimensions, measurement = workSheet['grouped']['query']
+            previous = workSheet['grouped']['df']
+            filters = workSheet['grouped'].get('filters')
+            sumBins = dict()
+            if self.partialCombiners(previous, measurement) is not None and groupedBins is not None:
+                # Sums, counts, minimums and maximums of the old and new rows combine group by group,
+                # float sums through their exact bins.
+                deltaBins = dict()
+                deltaGrouped = self.aggregate(self.applyFilters(delta, filters), dimensions, measurement, deltaBins)
+                levels = list(range(previous.index.nlevels))
+                merged = self.combinePartials([previous, deltaGrouped], levels, measurement)
+                merged.index.names = previous.index.names
+                sumBins = {eachMeasurement: _combineSumBins([bins, deltaBins[eachMeasurement]], levels)
+                           for eachMeasurement, bins in groupedBins.items() if eachMeasurement in deltaBins}
+                for bins in sumBins.values():
+                    bins.index.names = previous.index.names
+                merged = self.finishSums(merged, measurement, sumBins)
+            else:
+                merged = self.aggregate(self.applyFilters(df, filters), dimensions, measurement, sumBins)
+            grouped = (workSheet['grouped'], merged, self.nullDimensions(self.applyFilters(df, filters), dimensions), sumBins)
+
+        refresh.update({'df': df, 'sourceKey': sourceKey, 'cube': cube, 'columnsValue': columnsValue, 'grouped': grouped})
+        return refresh
+
+    def applyRefresh(self, refresh):
+        '''Install what prepareRefresh worked out and return the number of rows appended, or None if another table was loaded meanwhile.'''
+        workSheet = refresh['workSheet']
+        if self.workSheet is not workSheet or workSheet['df'] is not refresh['oldDF']:
+            return None
+        if refresh['rows'] == 0:
+            return 0
+        workSheet['df'] = refresh['df']
+        workSheet['sourceKey'] = refresh['sourceKey']
+        workSheet['cube'] = refresh['cube']
+        # Values listed while the rows were read came from the old table; they are listed again on use.
+        workSheet['columnsValue'] = refresh['columnsValue']
+        if refresh['grouped'] is not None:
+            grouped, merged, nullDimensions, sumBins = refresh['grouped']
+            dimensions, measurement = grouped['query']
+            filters = grouped.get('filters')
+            # A grouping chosen meanwhile is kept; the refreshed one still goes to the cache.
+            if workSheet['grouped'] is grouped:
+                grouped['df'] = merged
+                grouped['filterGrouped'] = merged
+            self.aggregationCache.put(self.aggregationKey(workSheet['df'], dimensions, measurement, filters), merged,
+                                      nullDimensions, sumBins)
+        return refresh['rows']
 
     def rangeSelect(self, df, startRow=0, stopRow=None, startColumn=0, stopColumn=None):
         '''Select Columns and Row Range.'''
@@ -178,9 +2160,131 @@ class DataOrganization(FileManagement):
 
 
 
+class LoadCancelled(Exception):
+    '''Raised inside a SheetLoader when its load has been cancelled.'''
+
+
+class SheetIngester(QtCore.QObject):
+    '''Parse every sheet of the current workbook on a worker thread, reporting the outcome through a Qt signal.'''
+    finished = QtCore.pyqtSignal(str)
+
+    def __init__(self, dataOrganization):
+        super(SheetIngester, self).__init__()
+        self.dataOrganization = dataOrganization
+
+    def run(self):
+        startTime = time.time()
+        try:
+            failures = self.dataOrganization.ingestAllSheets()
+        except (OSError, ValueError) as error:
+            self.finished.emit('Could not load the sheets: {0}'.format(error))
+            return
+        message = 'Loaded {0} sheets in {1:.1f}s'.format(len(self.dataOrganization.ingestedSheets), time.time() - startTime)
+        if failures:
+            message += '; could not load ' + ', '.join('{0} ({1})'.format(eachSheet, error) for eachSheet, error in failures.items())
+        self.finished.emit(message)
+
+
+class SheetRefresher(QtCore.QObject):
+    '''Read the rows appended to the current sheet on a worker thread, handing the new state back through a Qt signal.'''
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, dataOrganization, sheetName):
+        super(SheetRefresher, self).__init__()
+        self.dataOrganization = dataOrganization
+        self.sheetName = sheetName
+
+    def run(self):
+        try:
+            refresh = self.dataOrganization.prepareRefresh()
+        except Exception as error:
+            self.failed.emit('Could not refresh {0}: {1}'.format(self.sheetName, error))
+            return
+        self.finished.emit(refresh)
+
+
+class SheetLoader(QtCore.QObject):
+    '''Load and classify a sheet on a worker thread, reporting progress through Qt signals.'''
+    progress = QtCore.pyqtSignal(int, float, float)
+    preview = QtCore.pyqtSignal(object)
+    loaded = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, dataOrganization, sheetName, chunkSize, totalRows=None, projected=False):
+        super(SheetLoader, self).__init__()
+        self.dataOrganization = dataOrganization
+        self.sheetName = sheetName
+        self.chunkSize = chunkSize
+        self.totalRows = totalRows
+        self.projected = projected
+        self.cancelled = False
+        self.startTime = None
+
+    def cancel(self):
+        self.cancelled = True
+
+    def checkCancelled(self):
+        if self.cancelled:
+            raise LoadCancelled()
+
+    def onChunk(self, chunk, rowsRead):
+        self.checkCancelled()
+        elapsed = time.time() - self.startTime
+        eta = -1.0
+        if self.totalRows:
+            eta = max(self.totalRows - rowsRead, 0) * elapsed / rowsRead
+        self.progress.emit(rowsRead, elapsed, eta)
+        if rowsRead == len(chunk):
+            # The first chunk is classified straight away so the columns can be browsed
+            # while the rest of the sheet streams in.
+            self.preview.emit(self.dataOrganization.getColumnsType(chunk))
+
+    def run(self):
+        self.startTime = time.time()
+        try:
+            if self.projected:
+                # Classify from a sample; columns are read later as they are used.
+                sample = self.dataOrganization.sampleSheet(self.sheetName)
+                result = self.dataOrganization.getColumnsType(sample)
+                result['columns'] = list(sample.columns)
+                result['df'] = pd.DataFrame()
+                result['columnsValue'] = dict()
+            else:
+                df = self.dataOrganization.loadSheetFrame(self.sheetName, self.chunkSize, self.onChunk)
+                self.checkCancelled()
+                result = self.dataOrganization.getColumnsType(df)
+                if self.dataOrganization.compactOnLoad:
+                    df, result['memoryBefore'], result['memoryAfter'] = self.dataOrganization.compactFrame(df, result['dimensions'])
+                    self.checkCancelled()
+                result['df'] = df
+                result['columnsValue'] = dict()
+                for eachColumn in df.columns:
+                    self.checkCancelled()
+                    result['columnsValue'][eachColumn] = self.dataOrganization.uniqueValues(df[eachColumn])
+            result['elapsed'] = time.time() - self.startTime
+        except LoadCancelled:
+            return
+        except Exception as error:
+            self.failed.emit('Could not load {0}: {1}'.format(self.sheetName, error))
+            return
+        if not self.cancelled:
+            self.loaded.emit(result)
+
+
 class Ui_MainWindow(DataOrganization):
     numColumnsList = 0
     numRowsList = 0
+    sheetChunkSize = 50000
+    largeSheetCells = 20000000
+    sheetLoader = None
+    sheetIngester = None
+    sheetRefresher = None
+    autosaveInterval = 30000
+    autosaveThread = None
+    autosaveError = None
+    projectPath = None
+    cubeThread = None
 
     def __init__(self):
         DataOrganization.__init__(self)
@@ -512,6 +2616,50 @@ class Ui_MainWindow(DataOrganization):
         self.actionSave.setShortcut("Ctrl+S")
         self.actionSave.triggered.connect(self.saveFileDialog)
 
+        self.actionIngest = QtWidgets.QAction(MainWindow)
+        self.actionIngest.setObjectName("actionIngest")
+        self.actionIngest.setText("Load All Sheets")
+        self.actionIngest.triggered.connect(self.ingestAllSheetsDialog)
+
+        self.actionRefresh = QtWidgets.QAction(MainWindow)
+        self.actionRefresh.setObjectName("actionRefresh")
+        self.actionRefresh.setText("Refresh")
+        self.actionRefresh.setShortcut("F5")
+        self.actionRefresh.triggered.connect(self.refreshSheetDialog)
+
+        self.actionProjected = QtWidgets.QAction(MainWindow)
+        self.actionProjected.setObjectName("actionProjected")
+        self.actionProjected.setText("Load Columns On Demand")
+        self.actionProjected.setCheckable(True)
+
+        self.actionOutOfCore = QtWidgets.QAction(MainWindow)
+        self.actionOutOfCore.setObjectName("actionOutOfCore")
+        self.actionOutOfCore.setText("Aggregate Without Loading")
+        self.actionOutOfCore.setCheckable(True)
+        self.actionOutOfCore.toggled.connect(self.setOutOfCore)
+
+        self.actionCube = QtWidgets.QAction(MainWindow)
+        self.actionCube.setObjectName("actionCube")
+        self.actionCube.setText("Precompute Aggregations")
+        self.actionCube.setCheckable(True)
+
+        self.actionCollectGarbage = QtWidgets.QAction(MainWindow)
+        self.actionCollectGarbage.setObjectName("actionCollectGarbage")
+        self.actionCollectGarbage.setText("Clean Up Saved Data")
+        self.actionCollectGarbage.triggered.connect(self.collectGarbageDialog)
+
+        self.menuCompression = QtWidgets.QMenu(self.menuFile)
+        self.menuCompression.setObjectName("menuCompression")
+        self.menuCompression.setTitle("Compression")
+        self.compressionGroup = QtWidgets.QActionGroup(MainWindow)
+        for text, codec, level in (('None (fastest to open)', 'uncompressed', None), ('LZ4 (fast)', 'lz4', None),
+                                   ('Zstandard (balanced)', 'zstd', 1), ('Zstandard 9 (smallest)', 'zstd', 9)):
+            action = self.compressionGroup.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(codec == self.projectCodec and level == self.projectCodecLevel)
+            action.triggered.connect(lambda checked, codec=codec, level=level: self.setProjectCodec(codec, level))
+            self.menuCompression.addAction(action)
+
         self.actionExport = QtWidgets.QAction(MainWindow)
         self.actionExport.setObjectName("actionExport")
         self.actionExport.setText("Export")
@@ -520,13 +2668,24 @@ class Ui_MainWindow(DataOrganization):
 
         self.menuFile.addAction(self.actionOpen)
         self.menuFile.addAction(self.actionImport)
+        self.menuFile.addAction(self.actionIngest)
+        self.menuFile.addAction(self.actionRefresh)
+        self.menuFile.addAction(self.actionProjected)
+        self.menuFile.addAction(self.actionOutOfCore)
+        self.menuFile.addAction(self.actionCube)
         self.menuFile.addAction(self.actionSave)
+        self.menuFile.addMenu(self.menuCompression)
         self.menuFile.addAction(self.actionExport)
+        self.menuFile.addAction(self.actionCollectGarbage)
         self.menubar.addAction(self.menuFile.menuAction())
 
         self.tabWidget.setCurrentIndex(0)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
+        self.autosaveTimer = QtCore.QTimer(MainWindow)
+        self.autosaveTimer.timeout.connect(self.autosave)
+        self.autosaveTimer.start(self.autosaveInterval)
+
     def addDropDownWidget(self):
         self.dropdownButton = QtWidgets.QToolButton(self)
         self.dropdownButton.setPopupMode(QtWidgets.QToolButton.MenuButtonPopup)
@@ -548,6 +2707,7 @@ class Ui_MainWindow(DataOrganization):
         if directory != '':
             fileName = directory.split('/')[-1]
             extension = fileName.split('.')[-1]
+            self.cancelSheetLoader()
             self.sheetListWidget.clear()
             self.dimensionWidget.clear()
             self.measurementWidget.clear()
@@ -559,9 +2719,23 @@ class Ui_MainWindow(DataOrganization):
                 self.readExcel(fileName)
                 self.getSheet()
                 self.addListObject(self.workSheet['sheets'], self.sheetListWidget)
+                self.setSheetToolTips()
 
-            elif extension == 'pkl':
-                self.loadFile(fileName)
+            elif extension in ('csv', 'tsv', 'parquet'):
+                if extension == 'parquet':
+                    self.readParquet(fileName)
+                else:
+                    self.readDelimited(fileName, '\t' if extension == 'tsv' else ',')
+                self.getSheet()
+                self.addListObject(self.workSheet['sheets'], self.sheetListWidget)
+                self.setSheetToolTips()
+
+            elif extension in ('pkl', 'biproj'):
+                if extension == 'pkl':
+                    self.loadFile(fileName)
+                else:
+                    self.loadProject(fileName)
+                    self.projectPath = fileName
 
                 self.addListObject(self.workSheet['sheets'], self.sheetListWidget)
 
@@ -574,18 +2748,154 @@ class Ui_MainWindow(DataOrganization):
                 self.addListObject(self.workSheet['selectedRows'], self.rowListWidget)
 
                 if self.workSheet['currentSelectedFilter'] is not None:
-                    checkBoxes = self.getCheckBoxes(self.workSheet['columnsValue'][self.workSheet['currentSelectedFilter']])
+                    checkBoxes = self.getCheckBoxes(self.getColumnValues(self.workSheet['currentSelectedFilter']))
                     for eachCheckBox in checkBoxes:
                         self.filterListWidget.addItem(eachCheckBox)
 
+    def cancelSheetLoader(self):
+        '''Drop the sheet still loading, so that it cannot replace the table about to be opened.'''
+        if self.sheetLoader is not None:
+            self.sheetLoader.cancel()
+            self.sheetLoader = None
+        # A refresh still reading is ignored when it finishes.
+        self.sheetRefresher = None
+        self.setColumnsPreview(False)
+
+    def loadFile(self, filePath):
+        self.cancelSheetLoader()
+        super(Ui_MainWindow, self).loadFile(filePath)
+
+    def loadProject(self, filePath):
+        self.cancelSheetLoader()
+        super(Ui_MainWindow, self).loadProject(filePath)
+
+    def setSheetToolTips(self):
+        for eachRow in range(self.sheetListWidget.count()):
+            item = self.sheetListWidget.item(eachRow)
+            dimension = self.workSheet.get('sheetDimensions', dict()).get(item.text())
+            if dimension is not None and dimension['rows'] is not None:
+                item.setToolTip('{0} rows x {1} columns'.format(dimension['rows'], dimension['columns']))
+
+    def isLargeSheetConfirmed(self, sheet):
+        '''Ask before parsing a sheet whose used range is larger than largeSheetCells.'''
+        dimension = self.workSheet.get('sheetDimensions', dict()).get(sheet.text())
+        if dimension is None or dimension['rows'] is None:
+            return True
+        if dimension['rows'] * dimension['columns'] <= self.largeSheetCells:
+            return True
+        answer = QtWidgets.QMessageBox.question(self.centralwidget, 'Large sheet',
+                                                '{0} has {1} rows x {2} columns and may take a long time to load. Continue?'
+                                                .format(sheet.text(), dimension['rows'], dimension['columns']))
+        return answer == QtWidgets.QMessageBox.Yes
+
     def saveFileDialog(self):
         fileName = QtWidgets.QFileDialog.getSaveFileName()
         fileName = fileName[0]
         self.getState()
 
         if fileName != '':
-            fileName = fileName.split('/')[-1] + '.pkl'
-            self.saveFile(fileName, self.workSheet)
+            fileName = fileName.split('/')[-1] + '.biproj'
+            self.projectPath = fileName
+            self.saveInBackground(fileName)
+            self.statusbar.showMessage('Saving {0}...'.format(fileName))
+
+    def saveInBackground(self, filePath):
+        '''Snapshot the work sheet here and write it as a project on a worker thread.'''
+        thread = Thread(target=self.writeProject, args=(filePath, self.snapshotWorkSheet()), daemon=True)
+        thread.start()
+        return thread
+
+    def writeProject(self, filePath, snapshot):
+        try:
+            self.saveProject(filePath, snapshot)
+        except (OSError, ValueError, TypeError) as error:
+            self.autosaveError = 'Could not save {0}: {1}'.format(filePath, error)
+
+    def getAutosavePath(self):
+        if self.projectPath is not None:
+            return self.projectPath + '.autosave.biproj'
+        return path.join(path.expanduser('~'), '.bi_autosave.biproj')
+
+    def buildCubeInBackground(self):
+        '''Precompute the aggregation cube of the loaded sheet on a worker thread.'''
+        thread = Thread(target=self.writeCube, args=(self.workSheet['df'],), daemon=True)
+        thread.start()
+        return thread
+
+    def writeCube(self, df):
+        try:
+            cube = self.buildCube(df)
+        except (OSError, ValueError, TypeError, KeyError) as error:
+            self.autosaveError = 'Could not precompute aggregations: {0}'.format(error)
+            return
+        # Another sheet may have been opened meanwhile; loading projected or out-of-core
+        # columns replaces the frame but not the rows it stands for.
+        if cube is not None and cube['sourceKey'] == self.frameSource(self.workSheet['df']):
+            self.workSheet['cube'] = cube
+
+    def autosave(self):
+        if self.autosaveError is not None:
+            self.statusbar.showMessage(self.autosaveError)
+            self.autosaveError = None
+        if self.autosaveThread is not None and self.autosaveThread.is_alive():
+            return
+        if self.sheetLoader is not None or self.workSheet.get('sheetName') is None:
+            return
+        self.getState()
+        self.autosaveThread = self.saveInBackground(self.getAutosavePath())
+
+    def ingestAllSheetsDialog(self):
+        if self.workSheet.get('filePath') is None or self.sheetIngester is not None:
+            return
+        ingester = SheetIngester(self)
+        ingester.finished.connect(self.showIngestedSheets)
+        self.sheetIngester = ingester
+        self.statusbar.showMessage('Loading all sheets...')
+        Thread(target=ingester.run, daemon=True).start()
+
+    def showIngestedSheets(self, message):
+        self.sheetIngester = None
+        self.statusbar.showMessage(message)
+
+    def setProjectCodec(self, codec, level):
+        self.projectCodec = codec
+        self.projectCodecLevel = level
+
+    def setOutOfCore(self, checked):
+        self.outOfCore = checked
+
+    def refreshSheetDialog(self):
+        sheetName = self.workSheet.get('sheetName')
+        if sheetName is None or self.sheetLoader is not None or self.sheetRefresher is not None:
+            return
+        refresher = SheetRefresher(self, sheetName)
+        refresher.finished.connect(lambda refresh, refresher=refresher: self.showRefreshedSheet(refresher, refresh))
+        refresher.failed.connect(lambda message, refresher=refresher: self.showRefreshFailure(refresher, message))
+        self.sheetRefresher = refresher
+        self.statusbar.showMessage('Refreshing {0}...'.format(sheetName))
+        Thread(target=refresher.run, daemon=True).start()
+
+    def showRefreshedSheet(self, refresher, refresh):
+        if refresher is not self.sheetRefresher:
+            return
+        self.sheetRefresher = None
+        if refresh is not None:
+            appended = self.applyRefresh(refresh)
+            if appended is not None:
+                self.statusbar.showMessage('Appended {0:,} rows to {1}'.format(appended, refresher.sheetName))
+            return
+        sheets = self.sheetListWidget.findItems(refresher.sheetName, QtCore.Qt.MatchExactly)
+        if sheets:
+            self.displayDimensionsMeasurements(sheets[0])
+
+    def showRefreshFailure(self, refresher, message):
+        if refresher is self.sheetRefresher:
+            self.sheetRefresher = None
+            self.statusbar.showMessage(message)
+
+    def collectGarbageDialog(self):
+        removed, freed = self.blobStore.collectGarbage()
+        self.statusbar.showMessage('Removed {0} unused data blobs, freeing {1:.1f} MB'.format(removed, freed / 1024 ** 2))
 
     def exportFileDialog(self):
         fileName = QtWidgets.QFileDialog.getSaveFileName()
@@ -593,16 +2903,75 @@ class Ui_MainWindow(DataOrganization):
         self.toExcel(fileName, 'sheet', self.workSheet['grouped']['filterGrouped'], self.workSheet['grouped']['graph'][0])
 
     def displayDimensionsMeasurements(self, sheet):
-        self.readSheet(sheet)
+        if not self.isLargeSheetConfirmed(sheet):
+            return
+        self.cancelSheetLoader()
         self.dimensionWidget.clear()
         self.measurementWidget.clear()
         self.columnListWidget.clear()
         self.rowListWidget.clear()
         self.filterListWidget.clear()
-        self.classifyDimensionMeasurement(self.workSheet["df"])
+
+        totalRows = None
+        dimension = self.workSheet.get('sheetDimensions', dict()).get(sheet.text())
+        if dimension is not None and dimension['rows'] is not None:
+            totalRows = dimension['rows'] - 1
+        projected = self.actionProjected.isChecked() or self.outOfCore
+        loader = SheetLoader(self, sheet.text(), self.sheetChunkSize, totalRows, projected)
+        loader.progress.connect(self.showLoadProgress)
+        loader.preview.connect(lambda result, loader=loader: self.showColumnsPreview(loader, result))
+        loader.loaded.connect(lambda result, loader=loader: self.showDimensionsMeasurements(loader, result))
+        loader.failed.connect(self.statusbar.showMessage)
+        loader.failed.connect(lambda message: self.setColumnsPreview(False))
+        self.sheetLoader = loader
+        self.statusbar.showMessage('Loading {0}...'.format(sheet.text()))
+        Thread(target=loader.run, daemon=True).start()
+
+    def showLoadProgress(self, rowsRead, elapsed, eta):
+        message = 'Loaded {0:,} rows in {1:.1f}s'.format(rowsRead, elapsed)
+        if eta >= 0:
+            message += ', about {0:.0f}s left'.format(eta)
+        self.statusbar.showMessage(message)
+
+    def showColumnsPreview(self, loader, result):
+        if loader is not self.sheetLoader or loader.cancelled:
+            return
+        self.dimensionWidget.clear()
+        self.measurementWidget.clear()
+        self.addListObject(result['dimensions'], self.dimensionWidget)
+        self.addListObject(result['measurements'], self.measurementWidget)
+        # Shown for browsing only: nothing can be dragged until the frame is set.
+        self.setColumnsPreview(True)
+
+    def setColumnsPreview(self, preview):
+        self.dimensionWidget.setEnabled(not preview)
+        self.measurementWidget.setEnabled(not preview)
+
+    def showDimensionsMeasurements(self, loader, result):
+        if loader is not self.sheetLoader or loader.cancelled:
+            return
+        self.sheetLoader = None
+        self.dimensionWidget.clear()
+        self.measurementWidget.clear()
+        self.setColumnsPreview(False)
+        projection = None
+        if loader.projected:
+            projection = {'sheetName': loader.sheetName, 'columns': result['columns']}
+        self.setSheetFrame(result['df'], loader.sheetName, projection)
+        self.workSheet['dimensions'] = result['dimensions']
+        self.workSheet['measurements'] = result['measurements']
+        self.workSheet['columnsValue'] = result['columnsValue']
         self.addListObject(self.workSheet['dimensions'], self.dimensionWidget)
         self.addListObject(self.workSheet['measurements'], self.measurementWidget)
-        self.multiThread(self.getColumnValue, list(self.workSheet['df'].columns))
+        if self.actionCube.isChecked():
+            self.cubeThread = self.buildCubeInBackground()
+        if loader.projected:
+            self.statusbar.showMessage('Read the columns of {0} in {1:.1f}s'.format(loader.sheetName, result['elapsed']))
+        else:
+            message = 'Loaded {0:,} rows of {1} in {2:.1f}s'.format(len(result['df']), loader.sheetName, result['elapsed'])
+            if 'memoryBefore' in result:
+                message += ', memory {0:.1f} MB -> {1:.1f} MB'.format(result['memoryBefore'] / 1024 ** 2, result['memoryAfter'] / 1024 ** 2)
+            self.statusbar.showMessage(message)
 
     def getCheckBoxes(self, column):
         items = list()
@@ -627,7 +2996,7 @@ class Ui_MainWindow(DataOrganization):
     def deleteFilteredColumns(self, column):
         for eachFilter in list(self.workSheet['filteredColumns']):
             print(eachFilter)
-            if eachFilter in self.workSheet['columnsValue'][column]:
+            if eachFilter in self.getColumnValues(column):
                 self.workSheet['filteredColumns'].remove(eachFilter)
 
 
@@ -652,7 +3021,7 @@ class Ui_MainWindow(DataOrganization):
             self.filterListWidget.clear()
             self.numColumnsList = numColumnList
             self.workSheet['previousCurrentRow'] = column
-            checkBoxes = self.getCheckBoxes(self.workSheet['columnsValue'][column])
+            checkBoxes = self.getCheckBoxes(self.getColumnValues(column))
 
             for eachCheckBox in checkBoxes:
                 self.filterListWidget.addItem(eachCheckBox)
@@ -685,7 +3054,7 @@ class Ui_MainWindow(DataOrganization):
             self.filterListWidget.clear()
             self.numRowsList = numRowsList
             self.workSheet['previousCurrentRow'] = column
-            checkBoxes = self.getCheckBoxes(self.workSheet['columnsValue'][column])
+            checkBoxes = self.getCheckBoxes(self.getColumnValues(column))
 
             for eachCheckBox in checkBoxes:
                 self.filterListWidget.addItem(eachCheckBox)
@@ -715,6 +3084,9 @@ class Ui_MainWindow(DataOrganization):
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        runBenchmark(sys.argv[2:])
+        sys.exit(0)
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
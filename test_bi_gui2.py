@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as parquet
+import pytest
+
+import bi_gui2
+
+
+DIMENSIONS = (['Region'], ['Region', 'Product'])
+
+
+def salesFrame(rows=6000, seed=0):
+    '''Sales whose float sums depend on the order they are added in, with NaN, inf, missing keys and extreme magnitudes.'''
+    rng = np.random.default_rng(seed)
+    values = rng.standard_normal(rows) * 10.0 ** rng.integers(-20, 20, rows)
+    values[::7] = 1.0
+    values[3::17] = 2.0 ** 60
+    values[5::19] = -2.0 ** 60
+    values[::97] = np.nan
+    values[11::131] = 5e-324
+    region = rng.choice(['North', 'South', 'East', 'West'], rows).astype(object)
+    region[::11] = None
+    product = rng.choice(['p{0:02d}'.format(eachProduct) for eachProduct in range(40)], rows)
+    df = pd.DataFrame({'Region': region, 'Product': product, 'Sales': values})
+    # Past the exact grid, at most once per group, and infinities that do and do not cancel.
+    df.loc[(df['Region'] == 'North') & (df['Product'] == 'p00'), 'Sales'] = np.nan
+    df.loc[df.index[(df['Region'] == 'North') & (df['Product'] == 'p00')][0], 'Sales'] = 1e300
+    df.loc[df.index[(df['Region'] == 'South') & (df['Product'] == 'p01')][0], 'Sales'] = np.inf
+    df.loc[df.index[(df['Region'] == 'East') & (df['Product'] == 'p02')][:2], 'Sales'] = [np.inf, -np.inf]
+    return df
+
+
+def assertSameBits(result, expected):
+    assert list(result.index) == list(expected.index)
+    assert list(result.columns) == list(expected.columns)
+    result = result.to_numpy(dtype=np.float64)
+    expected = expected.to_numpy(dtype=np.float64)
+    assert np.array_equal(np.isnan(result), np.isnan(expected))
+    present = ~np.isnan(expected)
+    assert np.array_equal(result[present].view(np.int64), expected[present].view(np.int64))
+
+
+def grouped(dataOrganization, dimensions):
+    dataOrganization.groupData(dataOrganization.workSheet['df'], dimensions, 'Sales')
+    return dataOrganization.workSheet['grouped']['df']
+
+
+@pytest.fixture
+def newDataOrganization(tmp_path):
+    created = list()
+
+    def make(df=None, cached=False):
+        dataOrganization = bi_gui2.DataOrganization()
+        dataOrganization.sheetCache = bi_gui2.SheetCache(str(tmp_path / 'cache'))
+        dataOrganization.blobStore = bi_gui2.BlobStore(str(tmp_path / 'store'))
+        if not cached:
+            dataOrganization.aggregationCache.maxBytes = 0
+        if df is not None:
+            dataOrganization.setSheetFrame(df)
+            dataOrganization.workSheet['measurements'] = ['Sales']
+        created.append(dataOrganization)
+        return dataOrganization
+
+    yield make
+    for dataOrganization in created:
+        dataOrganization.closePool()
+
+
+@pytest.fixture
+def expected(newDataOrganization):
+    '''Every grouping reduced by pandas over the whole table in memory.'''
+    df = salesFrame()
+    dataOrganization = newDataOrganization(df)
+    return {tuple(dimensions): dataOrganization.aggregate(df, dimensions, 'Sales') for dimensions in DIMENSIONS}
+
+
+def testEdgeCasesReachTheSums(expected):
+    sums = expected[('Region', 'Product')]['Sales']
+    assert np.isposinf(sums.loc[('South', 'p01')])
+    assert np.isnan(sums.loc[('East', 'p02')])
+    assert sums.loc[('North', 'p00')] == 1e300
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testDimensionCodes(newDataOrganization, expected, dimensions):
+    assertSameBits(grouped(newDataOrganization(salesFrame()), dimensions), expected[tuple(dimensions)])
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testChunks(newDataOrganization, expected, dimensions):
+    df = salesFrame()
+    dataOrganization = newDataOrganization()
+    dataOrganization.workSheet['measurements'] = ['Sales']
+    chunks = (df.iloc[start:start + 777] for start in range(0, len(df), 777))
+    assertSameBits(dataOrganization.groupDataChunked(chunks, dimensions, 'Sales'), expected[tuple(dimensions)])
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testOutOfCore(tmp_path, newDataOrganization, expected, dimensions):
+    df = salesFrame()
+    parquet.write_table(pa.Table.from_pandas(df, preserve_index=False), str(tmp_path / 'sales.parquet'), row_group_size=1000)
+    dataOrganization = newDataOrganization()
+    dataOrganization.readParquet(str(tmp_path / 'sales.parquet'))
+    dataOrganization.setSheetFrame(pd.DataFrame(), sheetName='sales', projection={'sheetName': 'sales', 'columns': list(df.columns)})
+    dataOrganization.workSheet['measurements'] = ['Sales']
+    dataOrganization.outOfCore = True
+    dataOrganization.outOfCoreChunkSize = 900
+    assertSameBits(grouped(dataOrganization, dimensions), expected[tuple(dimensions)])
+    assert len(dataOrganization.workSheet['df'].columns) == 0
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testParallel(newDataOrganization, expected, dimensions):
+    dataOrganization = newDataOrganization(salesFrame())
+    dataOrganization.parallelRows = 1
+    dataOrganization.parallelProcesses = 2
+    assertSameBits(grouped(dataOrganization, dimensions), expected[tuple(dimensions)])
+    assert dataOrganization.pool is not None
+
+
+def testRollUp(newDataOrganization, expected):
+    dataOrganization = newDataOrganization(salesFrame(), cached=True)
+    grouped(dataOrganization, ['Region', 'Product'])
+    assertSameBits(grouped(dataOrganization, ['Region']), expected[('Region',)])
+    assert dataOrganization.aggregationCache.rollups == 1
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testRefresh(tmp_path, newDataOrganization, expected, dimensions):
+    df = salesFrame()
+    filePath = str(tmp_path / 'sales.parquet')
+    parquet.write_table(pa.Table.from_pandas(df.iloc[:4000], preserve_index=False), filePath)
+    dataOrganization = newDataOrganization(cached=True)
+    dataOrganization.readParquet(filePath)
+    dataOrganization.setSheetFrame(dataOrganization.streamSheet('sales'), sheetName='sales')
+    grouped(dataOrganization, dimensions)
+    parquet.write_table(pa.Table.from_pandas(df, preserve_index=False), filePath)
+    assert dataOrganization.refreshSheet() == len(df) - 4000
+    assertSameBits(dataOrganization.workSheet['grouped']['df'], expected[tuple(dimensions)])
+
+
+@pytest.mark.parametrize('dimensions', DIMENSIONS)
+def testCube(newDataOrganization, expected, dimensions):
+    dataOrganization = newDataOrganization(salesFrame())
+    cube = dataOrganization.buildCube(dataOrganization.workSheet['df'], ['Region', 'Product'], ['Sales'])
+    dataOrganization.workSheet['cube'] = cube
+    assert dataOrganization.lookupCube(dataOrganization.workSheet['df'], dimensions, 'Sales', None) is not None
+    assertSameBits(grouped(dataOrganization, dimensions), expected[tuple(dimensions)])
+
+
+def testOutOfCoreCube(tmp_path, newDataOrganization, expected):
+    df = salesFrame()
+    parquet.write_table(pa.Table.from_pandas(df, preserve_index=False), str(tmp_path / 'sales.parquet'), row_group_size=1000)
+    dataOrganization = newDataOrganization()
+    dataOrganization.readParquet(str(tmp_path / 'sales.parquet'))
+    dataOrganization.setSheetFrame(pd.DataFrame(), sheetName='sales', projection={'sheetName': 'sales', 'columns': list(df.columns)})
+    dataOrganization.workSheet['measurements'] = ['Sales']
+    dataOrganization.outOfCore = True
+    dataOrganization.outOfCoreChunkSize = 900
+    dataOrganization.workSheet['cube'] = dataOrganization.buildCube(dataOrganization.workSheet['df'], ['Region', 'Product'], ['Sales'])
+    for dimensions in DIMENSIONS:
+        assertSameBits(dataOrganization.lookupCube(dataOrganization.workSheet['df'], dimensions, 'Sales', None), expected[tuple(dimensions)])
+
+
+def testCubeRefresh(tmp_path, newDataOrganization, expected):
+    df = salesFrame()
+    filePath = str(tmp_path / 'sales.parquet')
+    parquet.write_table(pa.Table.from_pandas(df.iloc[:4000], preserve_index=False), filePath)
+    dataOrganization = newDataOrganization()
+    dataOrganization.readParquet(filePath)
+    dataOrganization.setSheetFrame(dataOrganization.streamSheet('sales'), sheetName='sales')
+    dataOrganization.workSheet['measurements'] = ['Sales']
+    dataOrganization.workSheet['cube'] = dataOrganization.buildCube(dataOrganization.workSheet['df'], ['Region', 'Product'], ['Sales'])
+    parquet.write_table(pa.Table.from_pandas(df, preserve_index=False), filePath)
+    assert dataOrganization.refreshSheet() == len(df) - 4000
+    for dimensions in DIMENSIONS:
+        assertSameBits(dataOrganization.lookupCube(dataOrganization.workSheet['df'], dimensions, 'Sales', None), expected[tuple(dimensions)])